@@ -1,40 +1,60 @@
 """Shared test fixtures and utilities."""
 
-import os
+import shutil
 import tempfile
+from copy import deepcopy
+from dataclasses import fields, replace
+from functools import lru_cache
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from pynput import keyboard
 
 from whisper_to_me.config import (
     AdvancedConfig,
     AppConfig,
     ConfigManager,
+    ContextConfig,
     GeneralConfig,
     ProcessingConfig,
     RecordingConfig,
+    TranscriptionConfig,
     UIConfig,
 )
 
 
-@pytest.fixture(autouse=True)
-def isolated_xdg_runtime_dir():
+@pytest.fixture(scope="session")
+def _xdg_runtime_dir_session():
     """
-    Override XDG_RUNTIME_DIR to avoid single instance collisions with production.
+    Override XDG_RUNTIME_DIR once per session to avoid collisions with production.
 
     This ensures test runs don't interfere with any actual whisper-to-me instances
     that might be running on the system by using a separate lock file location.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        old_xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
-        os.environ["XDG_RUNTIME_DIR"] = tmpdir
-        yield tmpdir
-        # Restore original value
-        if old_xdg_runtime is None:
-            os.environ.pop("XDG_RUNTIME_DIR", None)
+    with tempfile.TemporaryDirectory() as tmpdir, pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_RUNTIME_DIR", tmpdir)
+        yield Path(tmpdir)
+
+
+@pytest.fixture(autouse=True)
+def isolated_xdg_runtime_dir(_xdg_runtime_dir_session):
+    """Share the session runtime dir, removing anything a test left behind."""
+    yield str(_xdg_runtime_dir_session)
+    for entry in _xdg_runtime_dir_session.iterdir():
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
         else:
-            os.environ["XDG_RUNTIME_DIR"] = old_xdg_runtime
+            entry.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def fresh_xdg_runtime_dir(tmp_path, monkeypatch):
+    """Point XDG_RUNTIME_DIR at a pristine per-test directory."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -44,35 +64,43 @@ def temp_config_dir():
         yield Path(tmpdir)
 
 
+# Default section instances, built once at import. Treat as read-only and
+# derive variants with make_app_config(); a bare dataclasses.replace() would
+# share their list and dict fields.
+DEFAULTS = SimpleNamespace(
+    general=GeneralConfig(),
+    recording=RecordingConfig(),
+    ui=UIConfig(),
+    advanced=AdvancedConfig(),
+    processing=ProcessingConfig(),
+    transcription=TranscriptionConfig(),
+    context=ContextConfig(),
+)
+
+
+def make_app_config(**overrides: dict[str, Any]) -> AppConfig:
+    """
+    Build an AppConfig from defaults, overriding fields per section.
+
+    Example: ``make_app_config(general={"model": "tiny"}, ui={"use_tray": False})``.
+    Every section is a fresh copy, so callers may mutate the result freely.
+    """
+    sections = {
+        # Deep-copy first: replace() is shallow and would share list/dict fields
+        f.name: replace(
+            deepcopy(getattr(DEFAULTS, f.name)), **overrides.get(f.name, {})
+        )
+        for f in fields(AppConfig)
+        if f.name != "profiles"
+    }
+    return AppConfig(**sections, profiles={})
+
+
 @pytest.fixture
 def default_test_config():
     """Create a default test configuration."""
-    return AppConfig(
-        general=GeneralConfig(
-            model="tiny",  # Use tiny model for tests
-            device="cpu",
-            language="en",
-            debug=False,
-            last_profile="default",
-            trailing_space=False,
-        ),
-        recording=RecordingConfig(
-            mode="push-to-talk",
-            trigger_key="<scroll_lock>",
-            discard_key="<esc>",
-            audio_device=None,
-        ),
-        ui=UIConfig(use_tray=True),
-        advanced=AdvancedConfig(
-            chunk_size=512,
-            vad_filter=True,
-            initial_prompt="",
-            min_silence_duration_ms=2000,
-            speech_pad_ms=400,
-        ),
-        processing=ProcessingConfig(),
-        profiles={},
-    )
+    # Use tiny model on CPU for tests
+    return make_app_config(general={"model": "tiny", "device": "cpu", "language": "en"})
 
 
 @pytest.fixture
@@ -106,12 +134,16 @@ def mock_sounddevice():
 
 
 @pytest.fixture
-def mock_pystray():
+def mock_pystray(monkeypatch):
     """Mock pystray for GUI tests."""
-    with patch("whisper_to_me.menu_builder.pystray") as mock_pystray:
-        # Set up Menu.SEPARATOR
-        mock_pystray.Menu.SEPARATOR = "SEPARATOR"
-        yield mock_pystray
+    from whisper_to_me import menu_builder
+
+    # Spec'd on the real module so typos and removed pystray APIs fail loudly
+    mock_pystray = MagicMock(spec=menu_builder.pystray)
+    # Set up Menu.SEPARATOR
+    mock_pystray.Menu.SEPARATOR = "SEPARATOR"
+    monkeypatch.setattr(menu_builder, "pystray", mock_pystray)
+    return mock_pystray
 
 
 @pytest.fixture
@@ -127,26 +159,74 @@ def mock_whisper_model():
         yield mock_model_class
 
 
+class FakeHotKey:
+    """Stand-in for pynput's HotKey that records the keys it is fed."""
+
+    __slots__ = ("keys", "on_activate", "pressed", "released")
+
+    parse = staticmethod(keyboard.HotKey.parse)
+
+    def __init__(self, keys, on_activate):
+        self.keys = keys
+        self.on_activate = on_activate
+        self.pressed = []
+        self.released = []
+
+    def press(self, key):
+        self.pressed.append(key)
+
+    def release(self, key):
+        self.released.append(key)
+
+
+class FakeListener:
+    """Stand-in for pynput's keyboard Listener that never starts a thread."""
+
+    __slots__ = ("on_press", "on_release", "started", "stopped")
+
+    def __init__(self, on_press=None, on_release=None):
+        self.on_press = on_press
+        self.on_release = on_release
+        self.started = False
+        self.stopped = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.stopped = True
+
+    def join(self):
+        pass
+
+    def canonical(self, key):
+        return key
+
+
 @pytest.fixture
-def mock_keyboard_hooks():
-    """Mock keyboard hooks for hotkey tests."""
-    with patch("whisper_to_me.hotkey_manager.keyboard") as mock_kb:
-        # Mock HotKey class
-        mock_hotkey = Mock()
-        mock_kb.HotKey.return_value = mock_hotkey
+def fake_keyboard(monkeypatch):
+    """Replace the hotkey manager's keyboard module with plain fakes."""
+    fake = SimpleNamespace(HotKey=FakeHotKey, Listener=FakeListener)
+    monkeypatch.setattr("whisper_to_me.hotkey_manager.keyboard", fake)
+    return fake
+
+
+@lru_cache(maxsize=128)
+def parse_hotkey(key_str: str) -> tuple:
+    """Parse a pynput key string once and reuse the result across tests."""
+    return tuple(keyboard.HotKey.parse(key_str))
+
 
-        # Mock Listener class
-        mock_listener = Mock()
-        mock_listener.start = Mock()
-        mock_listener.stop = Mock()
-        mock_kb.Listener.return_value = mock_listener
+class CounterCB:
+    """Slotted callback that counts its calls; cheaper to build than a Mock."""
 
-        # Keep parse function real by default
-        from pynput import keyboard
+    __slots__ = ("n",)
 
-        mock_kb.HotKey.parse = keyboard.HotKey.parse
+    def __init__(self):
+        self.n = 0
 
-        yield mock_kb
+    def __call__(self, *args, **kwargs):
+        self.n += 1
 
 
 def create_test_audio_devices():
@@ -1,5 +1,7 @@
 """Test component factory functionality."""
 
+from dataclasses import replace
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,6 +15,23 @@ from whisper_to_me.keystroke_handler import KeystrokeHandler
 from whisper_to_me.speech_processor import SpeechProcessor
 
 
+def _query_devices_lookup(devices):
+    """Build an ``sd.query_devices`` side effect backed by a dict lookup."""
+    lookup = {None: devices, **dict(enumerate(devices))}
+    return lambda device=None: lookup.get(device)
+
+
+@pytest.fixture(scope="session")
+def tray_callbacks():
+    """Tray callbacks, which the factory only passes through to TrayIcon."""
+    return SimpleNamespace(
+        on_quit=object(),
+        on_profile_change=object(),
+        on_device_change=object(),
+        get_devices=lambda: [],
+        get_current_device=lambda: None,
+    )
+
 
 @pytest.mark.usefixtures("isolated_xdg_runtime_dir")
 @patch("whisper_to_me.audio_device_manager.sd")
@@ -23,11 +42,13 @@ class TestComponentFactory:
     @pytest.fixture(autouse=True)
     def setup(self, default_test_config, config_manager_with_temp_file):
         """Set up test environment."""
-        self.config = default_test_config
-        self.config.recording.audio_device = {
-            "name": "Test Device",
-            "hostapi_name": "ALSA",
-        }
+        self.config = replace(
+            default_test_config,
+            recording=replace(
+                default_test_config.recording,
+                audio_device={"name": "Test Device", "hostapi_name": "ALSA"},
+            ),
+        )
 
         self.config_manager = config_manager_with_temp_file
         self.factory = ComponentFactory(self.config, self.config_manager)
@@ -48,17 +69,14 @@ class TestComponentFactory:
         expected_config = {"name": "Test Device", "hostapi_name": "ALSA"}
         assert device_manager._device_config == expected_config
 
+    @pytest.mark.slow
     def test_create_audio_recorder_success(self, mock_sd_recorder, mock_sd_manager):
         """Test successful audio recorder creation with real components."""
         # Set up mock sounddevice responses
         test_devices = create_test_audio_devices()
         test_hostapis = create_test_hostapis()
 
-        def query_devices_side_effect(device=None):
-            if device is None:
-                return test_devices
-            return test_devices[device] if device < len(test_devices) else None
-
+        query_devices_side_effect = _query_devices_lookup(test_devices)
         mock_sd_manager.query_devices.side_effect = query_devices_side_effect
         mock_sd_manager.query_hostapis.return_value = test_hostapis
 
@@ -77,6 +95,7 @@ class TestComponentFactory:
         # Device might be None if the test device isn't found
         assert recorder.device_id is None or isinstance(recorder.device_id, int)
 
+    @pytest.mark.slow
     def test_create_audio_recorder_device_failure_with_fallback(
         self, mock_sd_recorder, mock_sd_manager
     ):
@@ -85,11 +104,7 @@ class TestComponentFactory:
         test_devices = create_test_audio_devices()
         test_hostapis = create_test_hostapis()
 
-        def query_devices_side_effect(device=None):
-            if device is None:
-                return test_devices
-            return test_devices[device] if device < len(test_devices) else None
-
+        query_devices_side_effect = _query_devices_lookup(test_devices)
         mock_sd_manager.query_devices.side_effect = query_devices_side_effect
         mock_sd_manager.query_hostapis.return_value = test_hostapis
 
@@ -118,12 +133,15 @@ class TestComponentFactory:
         assert device_manager._device_config is None
         assert device_manager._current_device is None
 
+    @pytest.mark.slow
     def test_create_audio_recorder_default_device_failure(
         self, mock_sd_recorder, mock_sd_manager
     ):
         """Test audio recorder creation when even default device fails."""
         # Set up device manager with no specific device
-        self.config.recording.audio_device = None
+        self.factory.config = replace(
+            self.config, recording=replace(self.config.recording, audio_device=None)
+        )
         device_manager = self.factory.create_device_manager()
 
         # Make all device initialization fail
@@ -135,12 +153,15 @@ class TestComponentFactory:
         with pytest.raises(RuntimeError, match="Audio recorder initialization failed"):
             self.factory.create_audio_recorder(device_manager)
 
+    @pytest.mark.slow
     def test_create_audio_recorder_with_no_device(
         self, mock_sd_recorder, mock_sd_manager
     ):
         """Test audio recorder creation with no specific device configured."""
         # No audio device configured
-        self.config.recording.audio_device = None
+        self.factory.config = replace(
+            self.config, recording=replace(self.config.recording, audio_device=None)
+        )
         device_manager = self.factory.create_device_manager()
 
         # Mock successful stream creation
@@ -177,43 +198,32 @@ class TestComponentFactory:
         # It's passed as a parameter to type_text method
 
     @patch("whisper_to_me.tray_icon.TrayIcon")
-    def test_create_tray_icon(self, mock_tray_class, mock_sd_recorder, mock_sd_manager):
+    def test_create_tray_icon(
+        self, mock_tray_class, mock_sd_recorder, mock_sd_manager, tray_callbacks
+    ):
         """Test create_tray_icon method with callbacks."""
-        # Create mock callbacks
-        on_quit = Mock()
-        on_profile_change = Mock()
-        on_device_change = Mock()
-        get_devices = Mock(return_value=[])
-        get_current_device = Mock(return_value=None)
-
         # Mock tray instance
         mock_tray = Mock()
         mock_tray_class.return_value = mock_tray
 
         # Create tray icon
-        tray = self.factory.create_tray_icon(
-            on_quit=on_quit,
-            on_profile_change=on_profile_change,
-            on_device_change=on_device_change,
-            get_devices=get_devices,
-            get_current_device=get_current_device,
-        )
+        tray = self.factory.create_tray_icon(**vars(tray_callbacks))
 
         assert tray == mock_tray
 
         # Verify TrayIcon was created with correct arguments (order doesn't matter)
         mock_tray_class.assert_called_once()
         call_kwargs = mock_tray_class.call_args[1]
-        assert call_kwargs["on_quit"] == on_quit
-        assert call_kwargs["on_profile_change"] == on_profile_change
+        assert call_kwargs["on_quit"] is tray_callbacks.on_quit
+        assert call_kwargs["on_profile_change"] is tray_callbacks.on_profile_change
         assert call_kwargs["get_profiles"] == self.config_manager.get_profile_names
         assert (
             call_kwargs["get_current_profile"]
             == self.config_manager.get_current_profile
         )
-        assert call_kwargs["on_device_change"] == on_device_change
-        assert call_kwargs["get_devices"] == get_devices
-        assert call_kwargs["get_current_device"] == get_current_device
+        assert call_kwargs["on_device_change"] is tray_callbacks.on_device_change
+        assert call_kwargs["get_devices"] is tray_callbacks.get_devices
+        assert call_kwargs["get_current_device"] is tray_callbacks.get_current_device
 
     @patch("whisper_to_me.speech_processor.WhisperModel")
     def test_recreate_speech_processor_no_change(
@@ -236,10 +246,9 @@ class TestComponentFactory:
         old_config = self.config
 
         # Create new config with different model
-        from copy import deepcopy
-
-        new_config = deepcopy(self.config)
-        new_config.general.model = "base"
+        new_config = replace(
+            self.config, general=replace(self.config.general, model="base")
+        )
 
         processor = self.factory.recreate_speech_processor(old_config, new_config)
 
@@ -258,10 +267,9 @@ class TestComponentFactory:
         old_config = self.config
 
         # Create new config with different device
-        from copy import deepcopy
-
-        new_config = deepcopy(self.config)
-        new_config.general.device = "cuda"
+        new_config = replace(
+            self.config, general=replace(self.config.general, device="cuda")
+        )
 
         processor = self.factory.recreate_speech_processor(old_config, new_config)
 
@@ -280,10 +288,9 @@ class TestComponentFactory:
         old_config = self.config
 
         # Create new config with different language
-        from copy import deepcopy
-
-        new_config = deepcopy(self.config)
-        new_config.general.language = "fr"
+        new_config = replace(
+            self.config, general=replace(self.config.general, language="fr")
+        )
 
         processor = self.factory.recreate_speech_processor(old_config, new_config)
 
@@ -299,10 +306,12 @@ class TestComponentFactory:
         old_config = self.config
 
         # Create new config with different initial_prompt
-        from copy import deepcopy
-
-        new_config = deepcopy(self.config)
-        new_config.advanced.initial_prompt = "Medical transcription mode"
+        new_config = replace(
+            self.config,
+            advanced=replace(
+                self.config.advanced, initial_prompt="Medical transcription mode"
+            ),
+        )
 
         processor = self.factory.recreate_speech_processor(old_config, new_config)
 
@@ -1,49 +1,116 @@
 """Test profile switching functionality."""
 
 import os
-import shutil
-import tempfile
+import time
+import tomllib
+import uuid
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
-from whisper_to_me.config import (
-    AdvancedConfig,
-    AppConfig,
-    ConfigManager,
-    GeneralConfig,
-    ProcessingConfig,
-    RecordingConfig,
-    UIConfig,
-)
+import pytest
 
+from tests.conftest import make_app_config
+from whisper_to_me import config as config_module
+from whisper_to_me.config import AppConfig, ConfigManager
+from whisper_to_me.config_constants import DEFAULT_PROFILE
+from whisper_to_me.logger import get_logger
+
+
+@pytest.fixture(scope="session")
+def config_home_root(tmp_path_factory):
+    """Create the parent directory shared by every per-test HOME."""
+    return tmp_path_factory.mktemp("config-home")
 
-class TestConfigManager:
-    """Test cases for configuration management."""
 
-    def setup_method(self):
-        """Set up test environment with temporary config directory."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.original_home = os.environ.get("HOME")
-        self.original_xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
+@pytest.fixture(scope="session")
+def default_config_bytes(tmp_path_factory):
+    """Serialize the default config file once for the whole session."""
+    config_file = tmp_path_factory.mktemp("seed") / "config.toml"
+    ConfigManager(config_file=str(config_file)).load_config()
+    return config_file.read_bytes()
 
+
+@pytest.fixture
+def logged_warnings(monkeypatch):
+    """Capture messages passed to the shared logger's warning method."""
+    messages: list[str] = []
+    monkeypatch.setattr(
+        get_logger(),
+        "warning",
+        lambda message, *args, **kwargs: messages.append(message),
+    )
+    return messages
+
+
+@pytest.fixture(scope="class")
+def shared_config_manager(config_home_root):
+    """Create one HOME directory and ConfigManager for a whole test class."""
+    home = config_home_root / uuid.uuid4().hex
+    with pytest.MonkeyPatch.context() as mp:
         # Clear XDG_CONFIG_HOME to ensure we use HOME/.config
-        if "XDG_CONFIG_HOME" in os.environ:
-            del os.environ["XDG_CONFIG_HOME"]
+        mp.delenv("XDG_CONFIG_HOME", raising=False)
+        mp.setenv("HOME", str(home))
+        yield home, ConfigManager()
+
 
-        os.environ["HOME"] = self.temp_dir
-        self.config_manager = ConfigManager()
+def expected_applied_profile(
+    config: AppConfig, name: str, profiles: dict[str, Any]
+) -> AppConfig:
+    """Return what apply_profile() yields for a profile created from config.
 
-    def teardown_method(self):
-        """Clean up test environment."""
-        if self.original_home:
-            os.environ["HOME"] = self.original_home
+    Profiles are diffed against the defaults, so applying one over the default
+    base reproduces every section except last_profile, which names the profile.
+    """
+    return replace(
+        config,
+        general=replace(config.general, last_profile=name),
+        profiles=profiles,
+    )
 
-        # Restore XDG_CONFIG_HOME if it was set
-        if self.original_xdg_config_home:
-            os.environ["XDG_CONFIG_HOME"] = self.original_xdg_config_home
-        elif "XDG_CONFIG_HOME" in os.environ:
-            del os.environ["XDG_CONFIG_HOME"]
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+@pytest.fixture
+def in_memory_config_store(monkeypatch):
+    """Keep serialized TOML in memory instead of writing it to disk.
+
+    Saves still sanitize and serialize through the real code path, and reads
+    parse the stored bytes, so only the filesystem round-trip is skipped.
+    Reads fall back to the real file until the manager first writes a path.
+    """
+    store: dict[Path, bytes] = {}
+    read_config_file = ConfigManager._read_config_file
+
+    def save_config_to_file(manager, config_dict):
+        store[manager.config_file] = manager._serialize_config(config_dict)
+
+    def read_config(manager):
+        if manager.config_file in store:
+            return tomllib.loads(store[manager.config_file].decode())
+        return read_config_file(manager)
+
+    monkeypatch.setattr(ConfigManager, "_save_config_to_file", save_config_to_file)
+    monkeypatch.setattr(ConfigManager, "_read_config_file", read_config)
+    return store
+
+
+class TestConfigManager:
+    """Test cases for configuration management."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, shared_config_manager, default_config_bytes):
+        """Reset the shared config manager and its file to the defaults."""
+        # Only tests marked ``disk`` pay for TOML serialization
+        if request.node.get_closest_marker("disk") is None:
+            request.getfixturevalue("in_memory_config_store")
+
+        self.temp_dir, self.config_manager = shared_config_manager
+
+        # Seed the default config file instead of regenerating it per test
+        self.config_manager.config_file.write_bytes(default_config_bytes)
+        self.config_manager.current_profile = DEFAULT_PROFILE
+        self.config_manager._config = None
 
     def test_load_default_config(self):
         """Test loading default configuration."""
@@ -99,73 +166,41 @@ class TestConfigManager:
         self.config_manager.load_config()
 
         # Create Spanish profile
-        spanish_config = AppConfig(
-            general=GeneralConfig(
-                model="large-v3",
-                device="cuda",
-                language="es",
-                debug=False,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="push-to-talk",
-                trigger_key="<scroll_lock>",
-                discard_key="esc",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=True),
-            advanced=AdvancedConfig(
-                chunk_size=512,
-                vad_filter=True,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+        spanish_config = make_app_config(
+            general={"language": "es"}, recording={"discard_key": "esc"}
         )
         self.config_manager.create_profile("spanish", spanish_config)
 
         # Create work profile
-        work_config = AppConfig(
-            general=GeneralConfig(
-                model="medium",
-                device="cpu",
-                language="en",
-                debug=True,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="tap-mode",
-                trigger_key="<caps_lock>",
-                discard_key="esc",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=False),
-            advanced=AdvancedConfig(
-                chunk_size=1024,
-                vad_filter=False,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+        work_config = make_app_config(
+            general={
+                "model": "medium",
+                "device": "cpu",
+                "language": "en",
+                "debug": True,
+            },
+            recording={
+                "mode": "tap-mode",
+                "trigger_key": "<caps_lock>",
+                "discard_key": "esc",
+            },
+            ui={"use_tray": False},
+            advanced={"chunk_size": 1024, "vad_filter": False},
         )
         self.config_manager.create_profile("work", work_config)
 
         # Test switching to Spanish profile
         spanish_applied = self.config_manager.apply_profile("spanish")
-        assert spanish_applied.general.language == "es"
+        assert spanish_applied == expected_applied_profile(
+            spanish_config, "spanish", spanish_applied.profiles
+        )
         assert self.config_manager.get_current_profile() == "spanish"
 
         # Test switching to work profile
         work_applied = self.config_manager.apply_profile("work")
-        assert work_applied.general.model == "medium"
-        assert work_applied.general.device == "cpu"
-        assert work_applied.recording.mode == "tap-mode"
-        assert work_applied.recording.trigger_key == "<caps_lock>"
-        assert work_applied.ui.use_tray is False
+        assert work_applied == expected_applied_profile(
+            work_config, "work", work_applied.profiles
+        )
         assert self.config_manager.get_current_profile() == "work"
 
         # Test switching back to default
@@ -201,23 +236,10 @@ class TestConfigManager:
     def test_profile_inheritance(self):
         """Test that profiles inherit from base config."""
         # Load base config
-        config = self.config_manager.load_config()
+        self.config_manager.load_config()
 
         # Create profile that only changes model
-        minimal_config = AppConfig(
-            general=GeneralConfig(
-                model="tiny",
-                device="cuda",
-                language="auto",
-                debug=False,
-                last_profile="default",
-            ),
-            recording=config.recording,
-            ui=config.ui,
-            advanced=config.advanced,
-            processing=config.processing,
-            profiles={},
-        )
+        minimal_config = make_app_config(general={"model": "tiny"})
         self.config_manager.create_profile("minimal", minimal_config)
 
         # Apply profile
@@ -241,6 +263,8 @@ class TestConfigManager:
         assert result.general.model == "large-v3"
         assert self.config_manager.get_current_profile() == "default"
 
+    @pytest.mark.slow
+    @pytest.mark.disk
     def test_config_persistence(self):
         """Test that profiles persist across manager instances."""
         # Create profile with first manager
@@ -284,30 +308,21 @@ class TestConfigManager:
         self.config_manager.load_config()
 
         # Create comprehensive profile
-        comprehensive_config = AppConfig(
-            general=GeneralConfig(
-                model="base",
-                device="cpu",
-                language="de",
-                debug=True,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="tap-mode",
-                trigger_key="<caps_lock>",
-                discard_key="delete",
-                audio_device=1,
-            ),
-            ui=UIConfig(use_tray=False),
-            advanced=AdvancedConfig(
-                chunk_size=2048,
-                vad_filter=False,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+        comprehensive_config = make_app_config(
+            general={
+                "model": "base",
+                "device": "cpu",
+                "language": "de",
+                "debug": True,
+            },
+            recording={
+                "mode": "tap-mode",
+                "trigger_key": "<caps_lock>",
+                "discard_key": "delete",
+                "audio_device": 1,
+            },
+            ui={"use_tray": False},
+            advanced={"chunk_size": 2048, "vad_filter": False},
         )
 
         self.config_manager.create_profile("comprehensive", comprehensive_config)
@@ -315,26 +330,16 @@ class TestConfigManager:
         # Apply and verify all sections
         applied = self.config_manager.apply_profile("comprehensive")
 
-        assert applied.general.model == "base"
-        assert applied.general.device == "cpu"
-        assert applied.general.language == "de"
-        assert applied.general.debug is True
-
-        assert applied.recording.mode == "tap-mode"
-        assert applied.recording.trigger_key == "<caps_lock>"
-        assert applied.recording.discard_key == "delete"
-        assert applied.recording.audio_device == 1
-
-        assert applied.ui.use_tray is False
-
-        # sample_rate was removed from config
-        assert applied.advanced.chunk_size == 2048
-        assert applied.advanced.vad_filter is False
+        assert applied == expected_applied_profile(
+            comprehensive_config, "comprehensive", applied.profiles
+        )
 
+    @pytest.mark.slow
+    @pytest.mark.disk
     def test_custom_config_file_location(self):
         """Test using a custom config file location."""
         # Create a custom config file path
-        custom_config_path = Path(self.temp_dir) / "custom" / "config.toml"
+        custom_config_path = self.temp_dir / "custom" / "config.toml"
 
         # Create ConfigManager with custom path
         custom_manager = ConfigManager(config_file=str(custom_config_path))
@@ -351,62 +356,121 @@ class TestConfigManager:
         config.general.model = "tiny"
         custom_manager.create_profile("custom_profile", config)
 
-        # Create new manager with same custom path and verify profile exists
-        another_manager = ConfigManager(config_file=str(custom_config_path))
-        profiles = another_manager.get_profile_names()
-        assert "custom_profile" in profiles
+        # Verify the profile was persisted to the custom file
+        saved = tomllib.loads(custom_config_path.read_text(encoding="utf-8"))
+        assert "custom_profile" in saved["profiles"]
+
+    @pytest.mark.slow
+    @pytest.mark.disk
+    def test_repeated_loads_reuse_parsed_file(self):
+        """Test that an unchanged config file is only parsed once."""
+        first = self.config_manager.load_config()
 
-    def test_xdg_config_home_support(self):
+        with patch("whisper_to_me.config.tomllib.load") as mock_load:
+            second = self.config_manager.load_config()
+
+        mock_load.assert_not_called()
+        assert second == first
+        # Each load must still hand out independent objects
+        assert second.profiles is not first.profiles
+
+    @pytest.mark.slow
+    @pytest.mark.disk
+    def test_load_config_picks_up_external_edits(self):
+        """Test that editing the config file outside the manager is noticed."""
+        self.config_manager.load_config()
+
+        config_file = self.config_manager.config_file
+        content = config_file.read_text(encoding="utf-8")
+        config_file.write_text(
+            content.replace('model = "large-v3"', 'model = "tiny"', 1),
+            encoding="utf-8",
+        )
+
+        assert self.config_manager.load_config().general.model == "tiny"
+
+    @pytest.mark.slow
+    @pytest.mark.disk
+    @pytest.mark.parametrize("atomic", [False, True], ids=["in-place", "replace"])
+    def test_load_config_sees_same_size_edit_with_restored_mtime(self, atomic):
+        """Test that an edit keeping the size and mtime is not served from cache."""
+        config_file = self.config_manager.config_file
+        assert self.config_manager.load_config().general.language == "auto"
+        before = config_file.stat()
+
+        # Let the coarse filesystem clock tick so the edit gets a new ctime
+        time.sleep(0.05)
+        content = config_file.read_text(encoding="utf-8")
+        edited = content.replace('language = "auto"', 'language = "de"  ', 1)
+        assert len(edited) == len(content)
+        if atomic:
+            staged = config_file.with_suffix(".tmp")
+            staged.write_text(edited, encoding="utf-8")
+            os.replace(staged, config_file)
+        else:
+            config_file.write_text(edited, encoding="utf-8")
+        # Restore the mtime as cp -p, rsync -t and dotfile sync tools do
+        os.utime(config_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        after = config_file.stat()
+        assert (after.st_mtime_ns, after.st_size) == (
+            before.st_mtime_ns,
+            before.st_size,
+        )
+        fresh = ConfigManager(config_file=str(config_file))
+        assert fresh.load_config().general.language == "de"
+
+    @pytest.mark.slow
+    @pytest.mark.disk
+    def test_parse_cache_evicts_least_recently_used(
+        self, monkeypatch, tmp_path, default_config_bytes
+    ):
+        """Test that the parse cache stays bounded and evicts the oldest entry."""
+        monkeypatch.setattr(config_module, "_PARSE_CACHE", OrderedDict())
+        managers = []
+        for i in range(config_module._PARSE_CACHE_SIZE + 1):
+            config_file = tmp_path / f"config-{i}.toml"
+            config_file.write_bytes(default_config_bytes)
+            managers.append(ConfigManager(config_file=str(config_file)))
+
+        # Fill the cache, then touch the oldest entry so it becomes most recent
+        for manager in managers[:-1]:
+            manager.load_config()
+        managers[0].load_config()
+        managers[-1].load_config()
+
+        cached_paths = [key[0] for key in config_module._PARSE_CACHE]
+        assert len(cached_paths) == config_module._PARSE_CACHE_SIZE
+        assert str(managers[0].config_file) in cached_paths
+        assert str(managers[1].config_file) not in cached_paths
+        assert cached_paths[-1] == str(managers[-1].config_file)
+
+    @pytest.mark.slow
+    @pytest.mark.disk
+    def test_xdg_config_home_support(self, monkeypatch):
         """Test that XDG_CONFIG_HOME is respected when no custom config is specified."""
         # Set XDG_CONFIG_HOME
-        xdg_dir = Path(self.temp_dir) / "xdg_config"
-        os.environ["XDG_CONFIG_HOME"] = str(xdg_dir)
+        xdg_dir = self.temp_dir / "xdg_config"
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(xdg_dir))
 
-        try:
-            # Create new ConfigManager
-            xdg_manager = ConfigManager()
+        # Create new ConfigManager
+        xdg_manager = ConfigManager()
 
-            # Verify it uses XDG_CONFIG_HOME
-            expected_path = xdg_dir / "whisper-to-me" / "config.toml"
-            assert xdg_manager.config_file == expected_path
+        # Verify it uses XDG_CONFIG_HOME
+        expected_path = xdg_dir / "whisper-to-me" / "config.toml"
+        assert xdg_manager.config_file == expected_path
 
-            # Load config to create the file
-            xdg_manager.load_config()
-            assert expected_path.exists()
-        finally:
-            # Clean up XDG_CONFIG_HOME
-            if "XDG_CONFIG_HOME" in os.environ:
-                del os.environ["XDG_CONFIG_HOME"]
+        # Load config to create the file
+        xdg_manager.load_config()
+        assert expected_path.exists()
 
     def test_profile_creation_validation(self):
         """Test profile creation with various configurations."""
         self.config_manager.load_config()
 
         # Test creating profile with minimal changes
-        minimal = AppConfig(
-            general=GeneralConfig(
-                model="tiny",  # Only change model
-                device="cuda",
-                language="auto",
-                debug=False,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="push-to-talk",
-                trigger_key="<scroll_lock>",
-                discard_key="esc",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=True),
-            advanced=AdvancedConfig(
-                chunk_size=512,
-                vad_filter=True,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+        minimal = make_app_config(
+            general={"model": "tiny"}, recording={"discard_key": "esc"}
         )
 
         assert self.config_manager.create_profile("minimal_change", minimal) is True
@@ -452,12 +516,9 @@ class TestConfigManager:
         assert applied.general.model == "large-v3"
         assert applied.general.language == "es"
 
-    def test_profile_with_special_characters(self):
-        """Test profile names with special characters."""
-        config = self.config_manager.load_config()
-
-        # Test various special character profile names
-        special_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "profile-with-dashes",
             "profile_with_underscores",
             "profile.with.dots",
@@ -468,18 +529,21 @@ class TestConfigManager:
             "über-profile",
             "профиль",  # Cyrillic
             "プロファイル",  # Japanese
-        ]
+        ],
+    )
+    def test_profile_with_special_characters(self, name):
+        """Test profile names with special characters."""
+        config = self.config_manager.load_config()
 
-        for name in special_names:
-            config.general.model = "tiny"
-            assert self.config_manager.create_profile(name, config) is True
-            assert name in self.config_manager.get_profile_names()
+        config.general.model = "tiny"
+        assert self.config_manager.create_profile(name, config) is True
+        assert name in self.config_manager.get_profile_names()
 
-            # Verify we can apply the profile
-            applied = self.config_manager.apply_profile(name)
-            assert applied.general.model == "tiny"
+        # Verify we can apply the profile
+        applied = self.config_manager.apply_profile(name)
+        assert applied.general.model == "tiny"
 
-    def test_load_config_with_unknown_fields(self):
+    def test_load_config_with_unknown_fields(self, logged_warnings):
         """Test loading config with deprecated/unknown fields shows warnings."""
         # Create a config file with unknown fields
         config_dict = {
@@ -516,29 +580,28 @@ class TestConfigManager:
         # Write the config with unknown fields
         self.config_manager._save_config_to_file(config_dict)
 
-        # Capture log output
-        from unittest.mock import patch
-
-        with patch.object(self.config_manager.logger, "warning") as mock_warning:
-            # Load the config - should succeed despite unknown fields
-            config = self.config_manager.load_config()
-
-            # Verify the config loaded correctly with known fields
-            assert config.general.model == "tiny"
-            assert config.general.device == "cpu"
-            assert config.recording.mode == "push-to-talk"
-            assert config.ui.use_tray is True
-            assert config.advanced.chunk_size == 512
-
-            # Verify warnings were logged for unknown fields
-            warning_calls = [call[0][0] for call in mock_warning.call_args_list]
-            assert any("unknown_field" in msg for msg in warning_calls)
-            assert any("deprecated_option" in msg for msg in warning_calls)
-            assert any("future_feature" in msg for msg in warning_calls)
-            assert any("sample_rate" in msg for msg in warning_calls)
-            assert any("old_setting" in msg for msg in warning_calls)
-
-    def test_profile_with_unknown_fields(self):
+        # Load the config - should succeed despite unknown fields
+        config = self.config_manager.load_config()
+
+        # Verify the config loaded correctly with known fields
+        assert config.general.model == "tiny"
+        assert config.general.device == "cpu"
+        assert config.recording.mode == "push-to-talk"
+        assert config.ui.use_tray is True
+        assert config.advanced.chunk_size == 512
+
+        # Verify warnings were logged for unknown fields
+        warnings = "\n".join(logged_warnings)
+        for field_name in (
+            "unknown_field",
+            "deprecated_option",
+            "future_feature",
+            "sample_rate",
+            "old_setting",
+        ):
+            assert field_name in warnings
+
+    def test_profile_with_unknown_fields(self, logged_warnings):
         """Test applying profile with deprecated/unknown fields shows warnings."""
         # First create a valid config
         self.config_manager.load_config()
@@ -560,20 +623,17 @@ class TestConfigManager:
         self.config_manager.save_config()
 
         # Apply the profile and capture warnings
-        from unittest.mock import patch
+        applied = self.config_manager.apply_profile("test_unknown")
 
-        with patch.object(self.config_manager.logger, "warning") as mock_warning:
-            applied = self.config_manager.apply_profile("test_unknown")
-
-            # Verify known fields were applied
-            assert applied.general.model == "large-v3"
-            assert applied.advanced.vad_filter is False
+        # Verify known fields were applied
+        assert applied.general.model == "large-v3"
+        assert applied.advanced.vad_filter is False
 
-            # Verify warnings were logged for unknown fields
-            warning_calls = [call[0][0] for call in mock_warning.call_args_list]
-            # Note: These warnings come from config_differ.py
-            assert any("unknown_general_field" in msg for msg in warning_calls)
-            assert any("sample_rate" in msg for msg in warning_calls)
+        # Verify warnings were logged for unknown fields
+        # Note: These warnings come from config_differ.py
+        warnings = "\n".join(logged_warnings)
+        for field_name in ("unknown_general_field", "sample_rate"):
+            assert field_name in warnings
 
     def test_vad_parameters_configuration(self):
         """Test VAD parameters configuration and profile overrides."""
@@ -585,30 +645,9 @@ class TestConfigManager:
         assert config.advanced.speech_pad_ms == 400
 
         # Create a profile with custom VAD settings
-        fast_vad_config = AppConfig(
-            general=GeneralConfig(
-                model="tiny",
-                device="cpu",
-                language="auto",
-                debug=False,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="push-to-talk",
-                trigger_key="<scroll_lock>",
-                discard_key="<esc>",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=True),
-            advanced=AdvancedConfig(
-                chunk_size=512,
-                vad_filter=True,
-                initial_prompt="",
-                min_silence_duration_ms=500,  # Fast VAD
-                speech_pad_ms=100,  # Less padding
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+        fast_vad_config = make_app_config(
+            general={"model": "tiny", "device": "cpu"},
+            advanced={"min_silence_duration_ms": 500, "speech_pad_ms": 100},
         )
 
         # Create the profile
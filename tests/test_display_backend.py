@@ -1,8 +1,5 @@
 """Test display backend detection."""
 
-import os
-from unittest.mock import patch
-
 import pytest
 
 from whisper_to_me.display_backend import (
@@ -15,36 +12,32 @@ from whisper_to_me.display_backend import (
 class TestDetectBackend:
     """Test auto-detection logic."""
 
-    def test_detect_wayland_via_session_type(self):
+    def test_detect_wayland_via_session_type(self, monkeypatch):
         """Detect Wayland when XDG_SESSION_TYPE is set."""
-        with patch.dict(os.environ, {"XDG_SESSION_TYPE": "wayland"}, clear=False):
-            assert detect_backend() == DisplayBackend.WAYLAND
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
+        assert detect_backend() == DisplayBackend.WAYLAND
 
-    def test_detect_x11_via_session_type(self):
+    def test_detect_x11_via_session_type(self, monkeypatch):
         """Detect X11 when XDG_SESSION_TYPE is set."""
-        with patch.dict(os.environ, {"XDG_SESSION_TYPE": "x11"}, clear=False):
-            assert detect_backend() == DisplayBackend.X11
+        monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+        assert detect_backend() == DisplayBackend.X11
 
-    def test_detect_wayland_via_display_env(self):
+    def test_detect_wayland_via_display_env(self, monkeypatch):
         """Fallback to WAYLAND_DISPLAY when session type is missing."""
-        env = {"WAYLAND_DISPLAY": "wayland-0"}
-        with patch.dict(os.environ, env, clear=False):
-            # Remove XDG_SESSION_TYPE if present
-            os.environ.pop("XDG_SESSION_TYPE", None)
-            assert detect_backend() == DisplayBackend.WAYLAND
+        monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+        monkeypatch.delenv("XDG_SESSION_TYPE", raising=False)
+        assert detect_backend() == DisplayBackend.WAYLAND
 
-    def test_detect_x11_default(self):
+    def test_detect_x11_default(self, monkeypatch):
         """Default to X11 when no hints present."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Ensure clean env
-            os.environ.pop("XDG_SESSION_TYPE", None)
-            os.environ.pop("WAYLAND_DISPLAY", None)
-            assert detect_backend() == DisplayBackend.X11
+        monkeypatch.delenv("XDG_SESSION_TYPE", raising=False)
+        monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+        assert detect_backend() == DisplayBackend.X11
 
-    def test_case_insensitive_session_type(self):
+    def test_case_insensitive_session_type(self, monkeypatch):
         """XDG_SESSION_TYPE should be matched case-insensitively."""
-        with patch.dict(os.environ, {"XDG_SESSION_TYPE": "Wayland"}, clear=False):
-            assert detect_backend() == DisplayBackend.WAYLAND
+        monkeypatch.setenv("XDG_SESSION_TYPE", "Wayland")
+        assert detect_backend() == DisplayBackend.WAYLAND
 
 
 class TestResolveBackend:
@@ -68,7 +61,7 @@ class TestResolveBackend:
         with pytest.raises(ValueError, match="Unknown display backend"):
             resolve_backend("mir")
 
-    def test_none_auto_detects(self):
+    def test_none_auto_detects(self, monkeypatch):
         """None triggers auto-detection."""
-        with patch.dict(os.environ, {"XDG_SESSION_TYPE": "wayland"}, clear=False):
-            assert resolve_backend(None) == DisplayBackend.WAYLAND
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
+        assert resolve_backend(None) == DisplayBackend.WAYLAND
@@ -1,74 +1,59 @@
 """Test hotkey manager functionality."""
 
+from dataclasses import replace
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 from pynput import keyboard
 
-from whisper_to_me.config import AppConfig, RecordingConfig
+from tests.conftest import CounterCB, parse_hotkey
+from whisper_to_me.config import RecordingConfig
 from whisper_to_me.display_backend import DisplayBackend
-from whisper_to_me.hotkey_manager import HotkeyManager
+from whisper_to_me.hotkey_manager import HotkeyManager, _parse_hotkey_cached
 
+# Key sets for the default test keys, parsed once at import
+_TRIGGER = list(parse_hotkey("<ctrl>+<shift>+r"))
+_ESC = list(parse_hotkey("<esc>"))
 
+# Recording section template; setup_method copies it with dataclasses.replace
+_RECORDING = RecordingConfig(
+    trigger_key="<ctrl>+<shift>+r", discard_key="<esc>", mode="push-to-talk"
+)
+
+
+@pytest.mark.usefixtures("fake_keyboard")
 class TestHotkeyManager:
     """Test HotkeyManager functionality (X11/pynput backend)."""
 
     def setup_method(self):
         """Set up test environment."""
-        # Create test config
-        self.recording_config = RecordingConfig()
-        self.recording_config.trigger_key = "<ctrl>+<shift>+r"
-        self.recording_config.discard_key = "<esc>"
-        self.recording_config.mode = "push-to-talk"
+        # Tests mutate the section, so each one gets its own copy
+        self.recording_config = replace(_RECORDING)
 
-        self.config = Mock(spec=AppConfig)
-        self.config.recording = self.recording_config
+        # HotkeyManager only reads .recording
+        self.config = SimpleNamespace(recording=self.recording_config)
 
-    def test_init_push_to_talk_mode(self, mock_keyboard_hooks):
+    def test_init_push_to_talk_mode(self):
         """Test HotkeyManager initialization in push-to-talk mode."""
-        from pynput import keyboard
-
-        mock_keyboard_hooks.HotKey.parse = keyboard.HotKey.parse
-
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
         assert manager.config == self.config
-        assert manager.trigger_hotkey is not None
         assert manager.discard_hotkey is None  # Not used in push-to-talk
 
-        expected_trigger_keys = keyboard.HotKey.parse("<ctrl>+<shift>+r")
-        mock_keyboard_hooks.HotKey.assert_called_once_with(
-            expected_trigger_keys, manager._backend._handle_trigger_press
+        assert manager.trigger_hotkey.keys == _TRIGGER
+        assert (
+            manager.trigger_hotkey.on_activate == manager._backend._handle_trigger_press
         )
 
-    def test_init_tap_mode(self, mock_keyboard_hooks):
+    def test_init_tap_mode(self):
         """Test HotkeyManager initialization in tap mode."""
         self.config.recording.mode = "tap-mode"
 
-        from pynput import keyboard
-
-        mock_keyboard_hooks.HotKey.parse = keyboard.HotKey.parse
-
-        created_hotkeys = []
-
-        def track_hotkey(*args, **kwargs):
-            hotkey = Mock()
-            created_hotkeys.append((args, kwargs))
-            return hotkey
-
-        mock_keyboard_hooks.HotKey.side_effect = track_hotkey
-
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-        assert manager.trigger_hotkey is not None
-        assert manager.discard_hotkey is not None
-        assert len(created_hotkeys) == 2
-
-        trigger_keys = keyboard.HotKey.parse("<ctrl>+<shift>+r")
-        assert created_hotkeys[0][0][0] == trigger_keys
-
-        discard_keys = keyboard.HotKey.parse("<esc>")
-        assert created_hotkeys[1][0][0] == discard_keys
+        assert manager.trigger_hotkey.keys == _TRIGGER
+        assert manager.discard_hotkey.keys == _ESC
 
     def test_real_key_parsing(self):
         """Test that real key parsing works correctly."""
@@ -81,17 +66,17 @@ class TestHotkeyManager:
         ]
 
         for key_string, expected_keys in test_cases:
-            parsed = keyboard.HotKey.parse(key_string)
+            parsed = parse_hotkey(key_string)
             assert len(parsed) == len(expected_keys), f"Failed parsing {key_string}"
 
-    def test_set_callbacks(self, mock_keyboard_hooks):
+    def test_set_callbacks(self):
         """Test setting callback functions."""
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-        on_trigger_press = Mock()
-        on_trigger_tap = Mock()
-        on_discard_tap = Mock()
-        on_trigger_release = Mock()
+        on_trigger_press = CounterCB()
+        on_trigger_tap = CounterCB()
+        on_discard_tap = CounterCB()
+        on_trigger_release = CounterCB()
 
         manager.set_callbacks(
             on_trigger_press=on_trigger_press,
@@ -105,158 +90,182 @@ class TestHotkeyManager:
         assert manager.on_discard_tap == on_discard_tap
         assert manager.on_trigger_release == on_trigger_release
 
-    def test_start_listening(self, mock_keyboard_hooks):
+    def test_start_listening(self, fake_keyboard):
         """Test starting the keyboard listener."""
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
         manager.start_listening()
 
-        mock_keyboard_hooks.Listener.assert_called_once()
-        listener_instance = mock_keyboard_hooks.Listener.return_value
-        listener_instance.start.assert_called_once()
-        assert manager.listener == listener_instance
+        assert isinstance(manager.listener, fake_keyboard.Listener)
+        assert manager.listener.started is True
+        assert manager.listener.on_press == manager._backend.on_key_press
+        assert manager.listener.on_release == manager._backend.on_key_release
 
-    def test_stop_listening(self, mock_keyboard_hooks):
+    def test_stop_listening(self):
         """Test stopping the keyboard listener."""
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
         manager.start_listening()
+        listener = manager.listener
 
         manager.stop_listening()
 
-        listener_instance = mock_keyboard_hooks.Listener.return_value
-        listener_instance.stop.assert_called_once()
+        assert listener.stopped is True
         assert manager.listener is None
 
-    def test_stop_listening_no_active_listener(self, mock_keyboard_hooks):
+    def test_stop_listening_no_active_listener(self):
         """Test stopping when no listener is active."""
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
         manager.stop_listening()
         assert manager.listener is None
 
-    def test_handle_trigger_press_with_callback(self, mock_keyboard_hooks):
+    def test_handle_trigger_press_with_callback(self):
         """Test handling trigger press with callback."""
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-        on_press = Mock()
+        on_press = CounterCB()
         manager.set_callbacks(on_trigger_press=on_press)
 
         manager._handle_trigger_press()
-        on_press.assert_called_once()
+        assert on_press.n == 1
 
-    def test_handle_trigger_press_no_callback(self, mock_keyboard_hooks):
+    def test_handle_trigger_press_no_callback(self):
         """Test handling trigger press without callback."""
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
         manager._handle_trigger_press()
 
-    def test_handle_trigger_tap_with_callback(self, mock_keyboard_hooks):
+    def test_handle_trigger_tap_with_callback(self):
         """Test handling trigger tap with callback."""
         self.config.recording.mode = "tap-mode"
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-        on_tap = Mock()
+        on_tap = CounterCB()
         manager.set_callbacks(on_trigger_tap=on_tap)
 
         manager._handle_trigger_tap()
-        on_tap.assert_called_once()
+        assert on_tap.n == 1
 
-    def test_handle_discard_tap_with_callback(self, mock_keyboard_hooks):
+    def test_handle_discard_tap_with_callback(self):
         """Test handling discard tap with callback."""
         self.config.recording.mode = "tap-mode"
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-        on_discard = Mock()
+        on_discard = CounterCB()
         manager.set_callbacks(on_discard_tap=on_discard)
 
         manager._handle_discard_tap()
-        on_discard.assert_called_once()
-
-    def test_on_key_press_event(self, mock_keyboard_hooks):
-        """Test on_key_press event handling."""
+        assert on_discard.n == 1
+
+    @pytest.mark.parametrize("listening", [False, True])
+    @pytest.mark.parametrize("mode", ["push-to-talk", "tap-mode"])
+    @pytest.mark.parametrize(
+        ("handler", "recorded"),
+        [("on_key_press", "pressed"), ("on_key_release", "released")],
+    )
+    def test_key_event_dispatch(self, handler, recorded, mode, listening):
+        """Test that key events reach every active hotkey only while listening."""
+        self.config.recording.mode = mode
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
-        manager.start_listening()
-
-        mock_listener = mock_keyboard_hooks.Listener.return_value
-        mock_listener.canonical.return_value = keyboard.Key.ctrl
-
-        mock_trigger_hotkey = Mock()
-        manager._backend.trigger_hotkey = mock_trigger_hotkey
-
-        test_key = keyboard.Key.ctrl
-        manager.on_key_press(test_key)
-
-        mock_trigger_hotkey.press.assert_called_once_with(keyboard.Key.ctrl)
-
-    def test_on_key_release_event_push_to_talk(self, mock_keyboard_hooks):
-        """Test on_key_release event in push-to-talk mode."""
+        on_release = CounterCB()
+        manager.set_callbacks(on_trigger_release=on_release)
+        if listening:
+            manager.start_listening()
+
+        getattr(manager, handler)(keyboard.Key.esc)
+
+        expected = [keyboard.Key.esc] if listening else []
+        assert getattr(manager.trigger_hotkey, recorded) == expected
+        if mode == "tap-mode":
+            assert getattr(manager.discard_hotkey, recorded) == expected
+        else:
+            assert manager.discard_hotkey is None
+
+        # Only a push-to-talk release ends the recording
+        releases_recording = handler == "on_key_release" and mode == "push-to-talk"
+        assert on_release.n == int(listening and releases_recording)
+
+    def test_repeated_key_press_is_debounced(self):
+        """Test that auto-repeated presses reach the hotkeys only once."""
         manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
         manager.start_listening()
 
-        mock_listener = mock_keyboard_hooks.Listener.return_value
-        mock_listener.canonical.return_value = keyboard.Key.ctrl
-
-        mock_trigger_hotkey = Mock()
-        manager._backend.trigger_hotkey = mock_trigger_hotkey
+        for _ in range(3):
+            manager.on_key_press(keyboard.Key.esc)
+        manager.on_key_release(keyboard.Key.esc)
+        manager.on_key_press(keyboard.Key.esc)
 
-        on_release_callback = Mock()
-        manager.set_callbacks(on_trigger_release=on_release_callback)
+        assert manager.trigger_hotkey.pressed == [keyboard.Key.esc] * 2
 
-        test_key = keyboard.Key.ctrl
-        manager.on_key_release(test_key)
+    def test_config_update(self):
+        """Test updating configuration recreates hotkeys."""
+        HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-        mock_trigger_hotkey.release.assert_called_once_with(keyboard.Key.ctrl)
-        on_release_callback.assert_called_once()
+        self.config.recording.trigger_key = "<f9>"
 
-    def test_on_key_release_event_tap_mode(self, mock_keyboard_hooks):
-        """Test on_key_release event in tap mode."""
-        self.config.recording.mode = "tap-mode"
-        manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
-        manager.start_listening()
+        new_manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-        mock_listener = mock_keyboard_hooks.Listener.return_value
-        mock_listener.canonical.return_value = keyboard.Key.esc
+        assert new_manager.trigger_hotkey.keys == list(parse_hotkey("<f9>"))
+        assert new_manager.config.recording.trigger_key == "<f9>"
 
-        mock_trigger_hotkey = Mock()
-        mock_discard_hotkey = Mock()
-        manager._backend.trigger_hotkey = mock_trigger_hotkey
-        manager._backend.discard_hotkey = mock_discard_hotkey
+    def test_update_config_rebuilds_only_on_key_changes(self):
+        """Test that update_config keeps hotkeys whose settings are unchanged."""
+        manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
+        trigger = manager.trigger_hotkey
 
-        test_key = keyboard.Key.esc
-        manager.on_key_release(test_key)
+        # The discard key is unused in push-to-talk mode
+        self.config.recording.discard_key = "<delete>"
+        manager.update_config(self.config)
+        assert manager.trigger_hotkey is trigger
 
-        mock_trigger_hotkey.release.assert_called_once_with(keyboard.Key.esc)
-        mock_discard_hotkey.release.assert_called_once_with(keyboard.Key.esc)
+        self.config.recording.trigger_key = "<f9>"
+        manager.update_config(self.config)
+        assert manager.trigger_hotkey is not trigger
+        assert manager.trigger_hotkey.keys == list(parse_hotkey("<f9>"))
 
-    def test_config_update(self, mock_keyboard_hooks):
-        """Test updating configuration recreates hotkeys."""
-        from pynput import keyboard
+    def test_update_config_reuses_parsed_keys(self, fake_keyboard, monkeypatch):
+        """Test that identical key strings are only parsed once."""
+        _parse_hotkey_cached.cache_clear()
+        parse = Mock(wraps=keyboard.HotKey.parse)
+        monkeypatch.setattr(fake_keyboard.HotKey, "parse", parse)
 
-        mock_keyboard_hooks.HotKey.parse = keyboard.HotKey.parse
+        manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
+        manager.update_config(self.config)
 
-        HotkeyManager(self.config, backend=DisplayBackend.X11)
+        # Push-to-talk only parses the trigger key
+        assert parse.call_count == 1
 
-        self.config.recording.trigger_key = "<f9>"
+    def test_is_tap_mode_follows_config_updates(self):
+        """Test that the cached tap-mode flag is refreshed by update_config."""
+        manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
+        assert manager.is_tap_mode() is False
 
-        new_manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
+        tap_recording = replace(self.recording_config, mode="tap-mode")
+        manager.update_config(SimpleNamespace(recording=tap_recording))
 
-        assert new_manager.trigger_hotkey is not None
-        assert new_manager.config.recording.trigger_key == "<f9>"
+        assert manager.is_tap_mode() is True
+        assert manager.discard_hotkey is not None
 
-    def test_invalid_key_format(self, mock_keyboard_hooks):
+    def test_invalid_key_format(self):
         """Test handling invalid key format."""
-        from pynput import keyboard
-
-        mock_keyboard_hooks.HotKey.parse = keyboard.HotKey.parse
-
         self.config.recording.trigger_key = "invalid_key_format"
 
         with pytest.raises(ValueError):
             HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-    def test_complex_key_combinations(self, mock_keyboard_hooks):
-        """Test complex key combinations with real parsing."""
-        from pynput import keyboard
+    def test_update_config_invalid_key_keeps_hotkeys(self):
+        """Test that a rejected key update is retried instead of being skipped."""
+        manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
+        trigger = manager.trigger_hotkey
 
-        mock_keyboard_hooks.HotKey.parse = keyboard.HotKey.parse
+        self.config.recording.trigger_key = "bogus_key"
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                manager.update_config(self.config)
 
+        # The previous hotkey stays active until a valid key arrives
+        assert manager.trigger_hotkey is trigger
+        assert manager.trigger_hotkey.keys == list(parse_hotkey("<ctrl>+<shift>+r"))
+
+    def test_complex_key_combinations(self):
+        """Test complex key combinations with real parsing."""
         test_configs = [
             "<ctrl>+<alt>+<shift>+a",
             "<ctrl>+<f12>",
@@ -266,7 +275,7 @@ class TestHotkeyManager:
             self.config.recording.trigger_key = key_combo
             manager = HotkeyManager(self.config, backend=DisplayBackend.X11)
 
-            assert manager.trigger_hotkey is not None
+            assert manager.trigger_hotkey.keys == list(parse_hotkey(key_combo))
 
 
 class TestEvdevKeyMapping:
@@ -334,13 +343,10 @@ class TestEvdevHotkeyBackend:
 
     def setup_method(self):
         """Set up test config."""
-        self.recording_config = RecordingConfig()
-        self.recording_config.trigger_key = "<scroll_lock>"
-        self.recording_config.discard_key = "<esc>"
-        self.recording_config.mode = "push-to-talk"
+        self.recording_config = replace(_RECORDING, trigger_key="<scroll_lock>")
 
-        self.config = Mock(spec=AppConfig)
-        self.config.recording = self.recording_config
+        # HotkeyManager only reads .recording
+        self.config = SimpleNamespace(recording=self.recording_config)
 
     def test_evdev_backend_creation(self):
         """Test that the evdev backend can be created."""
@@ -355,7 +361,7 @@ class TestEvdevHotkeyBackend:
 
         backend = _EvdevHotkeyBackend(self.config)
 
-        on_press = Mock()
+        on_press = CounterCB()
         backend.on_trigger_press = on_press
 
         # Simulate the trigger key press
@@ -363,7 +369,7 @@ class TestEvdevHotkeyBackend:
 
         backend._handle_event(ec.KEY_SCROLLLOCK, 1)  # key down
 
-        on_press.assert_called_once()
+        assert on_press.n == 1
 
     def test_evdev_backend_release_callback(self):
         """Test push-to-talk release callback."""
@@ -371,8 +377,8 @@ class TestEvdevHotkeyBackend:
 
         backend = _EvdevHotkeyBackend(self.config)
 
-        on_press = Mock()
-        on_release = Mock()
+        on_press = CounterCB()
+        on_release = CounterCB()
         backend.on_trigger_press = on_press
         backend.on_trigger_release = on_release
 
@@ -380,11 +386,11 @@ class TestEvdevHotkeyBackend:
 
         # Press trigger
         backend._handle_event(ec.KEY_SCROLLLOCK, 1)
-        on_press.assert_called_once()
+        assert on_press.n == 1
 
         # Release trigger
         backend._handle_event(ec.KEY_SCROLLLOCK, 0)
-        on_release.assert_called_once()
+        assert on_release.n == 1
 
     def test_evdev_backend_tap_mode(self):
         """Test tap mode with evdev backend."""
@@ -394,8 +400,8 @@ class TestEvdevHotkeyBackend:
 
         backend = _EvdevHotkeyBackend(self.config)
 
-        on_tap = Mock()
-        on_discard = Mock()
+        on_tap = CounterCB()
+        on_discard = CounterCB()
         backend.on_trigger_tap = on_tap
         backend.on_discard_tap = on_discard
 
@@ -403,14 +409,14 @@ class TestEvdevHotkeyBackend:
 
         # Trigger tap
         backend._handle_event(ec.KEY_SCROLLLOCK, 1)
-        on_tap.assert_called_once()
+        assert on_tap.n == 1
 
         # Release (shouldn't trigger discard)
         backend._handle_event(ec.KEY_SCROLLLOCK, 0)
 
         # Discard tap
         backend._handle_event(ec.KEY_ESC, 1)
-        on_discard.assert_called_once()
+        assert on_discard.n == 1
 
     def test_evdev_backend_combo_key(self):
         """Test key combination matching with evdev backend."""
@@ -420,20 +426,20 @@ class TestEvdevHotkeyBackend:
 
         backend = _EvdevHotkeyBackend(self.config)
 
-        on_press = Mock()
+        on_press = CounterCB()
         backend.on_trigger_press = on_press
 
         import evdev.ecodes as ec
 
         # Press ctrl, shift, r in sequence
         backend._handle_event(ec.KEY_LEFTCTRL, 1)
-        assert on_press.call_count == 0
+        assert on_press.n == 0
 
         backend._handle_event(ec.KEY_LEFTSHIFT, 1)
-        assert on_press.call_count == 0
+        assert on_press.n == 0
 
         backend._handle_event(ec.KEY_R, 1)
-        on_press.assert_called_once()
+        assert on_press.n == 1
 
     def test_evdev_backend_right_modifier(self):
         """Test that right modifier keys also match."""
@@ -443,7 +449,7 @@ class TestEvdevHotkeyBackend:
 
         backend = _EvdevHotkeyBackend(self.config)
 
-        on_press = Mock()
+        on_press = CounterCB()
         backend.on_trigger_press = on_press
 
         import evdev.ecodes as ec
@@ -451,4 +457,4 @@ class TestEvdevHotkeyBackend:
         # Use RIGHT ctrl
         backend._handle_event(ec.KEY_RIGHTCTRL, 1)
         backend._handle_event(ec.KEY_A, 1)
-        on_press.assert_called_once()
+        assert on_press.n == 1
@@ -5,61 +5,70 @@ from pynput import keyboard
 
 from whisper_to_me.config import ConfigManager
 
+_COMBINATIONS = [
+    "<scroll_lock>",
+    "<esc>",
+    "a",
+    "<ctrl>+<shift>+r",
+    "<alt>+<tab>",
+    "<ctrl>+-",
+]
+
+
+@pytest.fixture(scope="module")
+def module_config_manager(tmp_path_factory):
+    """Create one ConfigManager for the module; parsing does not touch its state."""
+    config_file = tmp_path_factory.mktemp("key_combinations") / "config.toml"
+    return ConfigManager(str(config_file))
+
+
+@pytest.fixture(scope="module")
+def parsed(module_config_manager):
+    """Parse every valid combination once and share the results across tests."""
+    return {
+        key_str: module_config_manager.parse_key_combination(key_str)
+        for key_str in _COMBINATIONS
+    }
+
 
 class TestKeyCombinations:
     """Test cases for key combination parsing using pynput HotKey.parse."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, module_config_manager):
         """Set up test environment."""
-        self.config_manager = ConfigManager()
+        self.config_manager = module_config_manager
 
-    def test_parse_single_keys(self):
+    @pytest.mark.parametrize("key_str", ["<scroll_lock>", "<esc>", "a"])
+    def test_parse_single_keys(self, parsed, key_str):
         """Test parsing single keys in pynput format."""
-        # Test that parse_key_combination works with pynput format
-        result = self.config_manager.parse_key_combination("<scroll_lock>")
+        result = parsed[key_str]
         assert isinstance(result, set)
         assert len(result) >= 1  # Should contain at least one key
 
-        result = self.config_manager.parse_key_combination("<esc>")
-        assert isinstance(result, set)
-        assert len(result) >= 1
-
-        result = self.config_manager.parse_key_combination("a")
-        assert isinstance(result, set)
-        assert len(result) >= 1
-
-    def test_parse_key_combinations(self):
+    @pytest.mark.parametrize(
+        ("key_str", "expected_len"),
+        [("<ctrl>+<shift>+r", 3), ("<alt>+<tab>", 2), ("<ctrl>+-", 2)],
+    )
+    def test_parse_key_combinations(self, parsed, key_str, expected_len):
         """Test parsing key combinations in pynput format."""
-        # Test that complex combinations parse successfully
-        result = self.config_manager.parse_key_combination("<ctrl>+<shift>+r")
-        assert isinstance(result, set)
-        assert len(result) == 3  # Should have all three keys
-
-        result = self.config_manager.parse_key_combination("<alt>+<tab>")
-        assert isinstance(result, set)
-        assert len(result) == 2  # Should have both keys
-
-        result = self.config_manager.parse_key_combination("<ctrl>+-")
+        result = parsed[key_str]
         assert isinstance(result, set)
-        assert len(result) == 2  # Should have ctrl and minus
-
-    def test_invalid_combinations_raise_errors(self):
+        assert len(result) == expected_len  # One entry per key in the combination
+
+    @pytest.mark.parametrize(
+        "key_str",
+        [
+            "<invalid_key>",  # Invalid key name
+            "ctrl+shift+r",  # Old format should fail
+            "",  # Empty string
+            "<ctrl>+asdf",  # Invalid combination
+        ],
+    )
+    def test_invalid_combinations_raise_errors(self, key_str):
         """Test that invalid key combinations raise ValueError."""
-        # Invalid key name
-        with pytest.raises(ValueError, match="Invalid key combination"):
-            self.config_manager.parse_key_combination("<invalid_key>")
-
-        # Old format should fail
-        with pytest.raises(ValueError, match="Invalid key combination"):
-            self.config_manager.parse_key_combination("ctrl+shift+r")
-
-        # Empty string
-        with pytest.raises(ValueError, match="Invalid key combination"):
-            self.config_manager.parse_key_combination("")
-
-        # Invalid combination
         with pytest.raises(ValueError, match="Invalid key combination"):
-            self.config_manager.parse_key_combination("<ctrl>+asdf")
+            self.config_manager.parse_key_combination(key_str)
 
     def test_parse_key_string_single_only(self):
         """Test that parse_key_string only accepts single keys."""
@@ -77,10 +86,10 @@ class TestKeyCombinations:
         with pytest.raises(ValueError, match="Expected single key, got combination"):
             self.config_manager.parse_key_string("<alt>+f")
 
-    def test_hotkey_integration(self):
+    def test_hotkey_integration(self, parsed):
         """Test that parsed keys work with pynput HotKey."""
         # Test that our parsing is compatible with HotKey
-        trigger_keys = self.config_manager.parse_key_combination("<ctrl>+<shift>+r")
+        trigger_keys = parsed["<ctrl>+<shift>+r"]
 
         # Should be able to create a HotKey with parsed keys
         callback_called = False
@@ -94,6 +103,6 @@ class TestKeyCombinations:
         assert hotkey is not None
 
         # Test single key too
-        single_keys = self.config_manager.parse_key_combination("<esc>")
+        single_keys = parsed["<esc>"]
         hotkey2 = keyboard.HotKey(single_keys, test_callback)
         assert hotkey2 is not None
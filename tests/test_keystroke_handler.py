@@ -1,248 +1,151 @@
 """Test keystroke handler functionality."""
 
-from unittest.mock import Mock, call, patch
+import subprocess
+import time
+from unittest.mock import Mock, call
+
+import pytest
+from pynput import keyboard
 
 from whisper_to_me.display_backend import DisplayBackend
 from whisper_to_me.keystroke_handler import KeystrokeHandler
 
 
-class TestKeystrokeHandler:
-    """Test KeystrokeHandler functionality (X11/pynput backend)."""
-
-    def setup_method(self):
-        """Set up test environment."""
-        with patch("pynput.keyboard.Controller"):
-            self.handler = KeystrokeHandler(backend=DisplayBackend.X11)
-
-    def test_init_default(self):
-        """Test KeystrokeHandler initialization with defaults."""
-        with patch("pynput.keyboard.Controller") as mock_controller:
-            mock_instance = Mock()
-            mock_controller.return_value = mock_instance
-
-            handler = KeystrokeHandler(backend=DisplayBackend.X11)
-
-            assert handler.typing_speed == 0.01
-            assert handler.fast_typing_delay_ms == 0
-            assert handler.keyboard_controller == mock_instance
-            mock_controller.assert_called_once()
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch):
+    """Replace time.sleep for every test so typing delays never block."""
+    sleep = Mock()
+    monkeypatch.setattr(time, "sleep", sleep)
+    return sleep
 
-    def test_init_custom_speed(self):
-        """Test KeystrokeHandler initialization with custom typing speed."""
-        with patch("pynput.keyboard.Controller") as mock_controller:
-            mock_instance = Mock()
-            mock_controller.return_value = mock_instance
 
-            handler = KeystrokeHandler(typing_speed=0.05, backend=DisplayBackend.X11)
+@pytest.fixture
+def mock_controller(monkeypatch):
+    """Replace pynput's keyboard Controller class with a Mock."""
+    controller = Mock()
+    monkeypatch.setattr(keyboard, "Controller", controller)
+    return controller
 
-            assert handler.typing_speed == 0.05
-            assert handler.keyboard_controller == mock_instance
 
-    @patch("time.sleep")
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_simple(self, mock_controller, mock_sleep):
-        """Test type_text with simple text."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
+@pytest.fixture
+def mock_keyboard(mock_controller):
+    """Return the Controller instance that X11 handlers type through."""
+    return mock_controller.return_value
 
-        handler = KeystrokeHandler(typing_speed=0.02, backend=DisplayBackend.X11)
-        handler.type_text("Hello")
 
-        # Should type each character with delays
-        expected_calls = [call("H"), call("e"), call("l"), call("l"), call("o")]
-        mock_keyboard.type.assert_has_calls(expected_calls)
+@pytest.fixture
+def mock_run(monkeypatch):
+    """Replace subprocess.run so the wtype backend never spawns a process."""
+    run = Mock()
+    monkeypatch.setattr(subprocess, "run", run)
+    return run
 
-        # Should have called sleep between each character
-        assert mock_sleep.call_count == 5
-        mock_sleep.assert_has_calls([call(0.02)] * 5)
 
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_empty(self, mock_controller):
-        """Test type_text with empty text."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
+@pytest.fixture
+def handler(mock_controller):
+    """Create an X11 KeystrokeHandler with default settings."""
+    return KeystrokeHandler(backend=DisplayBackend.X11)
 
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text("")
 
-        # Should not type anything
-        mock_keyboard.type.assert_not_called()
-
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_whitespace_only(self, mock_controller):
-        """Test type_text with whitespace-only text."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text("   \t\n  ")
-
-        # Should not type anything for whitespace-only text
-        mock_keyboard.type.assert_not_called()
-
-    @patch("time.sleep")
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_with_trailing_space(self, mock_controller, mock_sleep):
-        """Test type_text with trailing space."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text("Hi", trailing_space=True)
-
-        # Should type each character
-        expected_calls = [call("H"), call("i")]
-        mock_keyboard.type.assert_has_calls(expected_calls)
-
-        # Should press space key
-        mock_keyboard.press.assert_called_once()
-        mock_keyboard.release.assert_called_once()
-
-    @patch("time.sleep")
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_strips_input(self, mock_controller, mock_sleep):
-        """Test that type_text strips whitespace from input."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
+class TestKeystrokeHandler:
+    """Test KeystrokeHandler functionality (X11/pynput backend)."""
 
+    def test_init_default(self, mock_controller, mock_keyboard):
+        """Test KeystrokeHandler initialization with defaults."""
         handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text("  Hello  ")
-
-        # Should only type the stripped text
-        expected_calls = [call("H"), call("e"), call("l"), call("l"), call("o")]
-        mock_keyboard.type.assert_has_calls(expected_calls)
 
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_fast_simple(self, mock_controller):
-        """Test type_text_fast with simple text."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text_fast("Hello World")
+        assert handler.typing_speed == 0.01
+        assert handler.fast_typing_delay_ms == 0
+        assert handler.keyboard_controller == mock_keyboard
+        mock_controller.assert_called_once()
 
-        # Should type the whole text at once (stripped)
-        mock_keyboard.type.assert_called_once_with("Hello World")
+    def test_init_custom_speed(self, mock_keyboard):
+        """Test KeystrokeHandler initialization with custom typing speed."""
+        handler = KeystrokeHandler(typing_speed=0.05, backend=DisplayBackend.X11)
+
+        assert handler.typing_speed == 0.05
+        assert handler.keyboard_controller == mock_keyboard
+
+    @pytest.mark.parametrize(
+        ("text", "trailing_space", "typed"),
+        [
+            pytest.param("Hello", False, list("Hello"), id="simple"),
+            pytest.param("", False, [], id="empty"),
+            pytest.param("   \t\n  ", False, [], id="whitespace-only"),
+            pytest.param("Hi", True, list("Hi"), id="trailing-space"),
+            pytest.param("  Hello  ", False, list("Hello"), id="strips-input"),
+        ],
+    )
+    def test_type_text(self, handler, mock_keyboard, text, trailing_space, typed):
+        """Test type_text types the stripped text one character at a time."""
+        handler.type_text(text, trailing_space=trailing_space)
+
+        assert mock_keyboard.type.call_args_list == [call(c) for c in typed]
+        # A trailing space is a single press/release of the space key
+        assert mock_keyboard.press.call_count == int(trailing_space)
+        assert mock_keyboard.release.call_count == int(trailing_space)
+
+    @pytest.mark.parametrize(
+        ("text", "trailing_space", "typed"),
+        [
+            pytest.param("Hello World", False, ["Hello World"], id="simple"),
+            pytest.param("", False, [], id="empty"),
+            pytest.param("   \n\t   ", False, [], id="whitespace-only"),
+            pytest.param("Hello", True, ["Hello"], id="trailing-space"),
+            pytest.param("  Hello World  ", False, ["Hello World"], id="strips"),
+            pytest.param(
+                "Hello! @#$%^&*() 123", False, ["Hello! @#$%^&*() 123"], id="special"
+            ),
+            pytest.param("Héllo Wörld 🌍", False, ["Héllo Wörld 🌍"], id="unicode"),
+        ],
+    )
+    def test_type_text_fast(
+        self, handler, mock_keyboard, mock_sleep, text, trailing_space, typed
+    ):
+        """Test type_text_fast types the stripped text in one call, no delays."""
+        handler.type_text_fast(text, trailing_space=trailing_space)
+
+        assert mock_keyboard.type.call_args_list == [call(t) for t in typed]
+        assert mock_keyboard.press.call_count == int(trailing_space)
+        assert mock_keyboard.release.call_count == int(trailing_space)
+        mock_sleep.assert_not_called()
 
-    @patch("time.sleep")
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_fast_with_delay(self, mock_controller, mock_sleep):
+    def test_type_text_fast_with_delay(self, mock_keyboard, mock_sleep):
         """Test type_text_fast can add a small delay for sensitive clients."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
         handler = KeystrokeHandler(
             backend=DisplayBackend.X11, fast_typing_delay_ms=5
         )
         handler.type_text_fast("Hi")
 
-        mock_keyboard.type.assert_has_calls([call("H"), call("i")])
-        mock_sleep.assert_has_calls([call(0.005), call(0.005)])
-
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_fast_empty(self, mock_controller):
-        """Test type_text_fast with empty text."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text_fast("")
-
-        # Should not type anything
-        mock_keyboard.type.assert_not_called()
-
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_fast_whitespace_only(self, mock_controller):
-        """Test type_text_fast with whitespace-only text."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text_fast("   \n\t   ")
-
-        # Should not type anything for whitespace-only text
-        mock_keyboard.type.assert_not_called()
-
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_fast_with_trailing_space(self, mock_controller):
-        """Test type_text_fast with trailing space."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text_fast("Hello", trailing_space=True)
-
-        # Should type the text
-        mock_keyboard.type.assert_called_once_with("Hello")
+        assert mock_keyboard.type.call_args_list == [call("H"), call("i")]
+        assert mock_sleep.call_args_list == [call(0.005), call(0.005)]
 
-        # Should press space key
-        mock_keyboard.press.assert_called_once()
-        mock_keyboard.release.assert_called_once()
-
-    @patch("pynput.keyboard.Controller")
-    def test_type_text_fast_strips_input(self, mock_controller):
-        """Test that type_text_fast strips whitespace from input."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text_fast("  Hello World  ")
-
-        # Should only type the stripped text
-        mock_keyboard.type.assert_called_once_with("Hello World")
-
-    @patch("pynput.keyboard.Controller")
-    def test_press_key(self, mock_controller):
+    def test_press_key(self, handler, mock_keyboard):
         """Test press_key method."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        from pynput import keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
         handler.press_key(keyboard.Key.enter)
 
         # Should press and release the key
         mock_keyboard.press.assert_called_once_with(keyboard.Key.enter)
         mock_keyboard.release.assert_called_once_with(keyboard.Key.enter)
 
-    @patch("pynput.keyboard.Controller")
-    def test_add_space(self, mock_controller):
+    def test_add_space(self, handler, mock_keyboard):
         """Test add_space method."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        from pynput import keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
         handler.add_space()
 
         # Should press and release space key
         mock_keyboard.press.assert_called_once_with(keyboard.Key.space)
         mock_keyboard.release.assert_called_once_with(keyboard.Key.space)
 
-    @patch("pynput.keyboard.Controller")
-    def test_add_newline(self, mock_controller):
+    def test_add_newline(self, handler, mock_keyboard):
         """Test add_newline method."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        from pynput import keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
         handler.add_newline()
 
         # Should press and release enter key
         mock_keyboard.press.assert_called_once_with(keyboard.Key.enter)
         mock_keyboard.release.assert_called_once_with(keyboard.Key.enter)
 
-    @patch("time.sleep")
-    @patch("pynput.keyboard.Controller")
-    def test_typing_speed_respected(self, mock_controller, mock_sleep):
+    def test_typing_speed_respected(self, mock_keyboard, mock_sleep):
         """Test that typing speed is respected."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
         custom_speed = 0.1
         handler = KeystrokeHandler(
             typing_speed=custom_speed, backend=DisplayBackend.X11
@@ -250,104 +153,46 @@ class TestKeystrokeHandler:
         handler.type_text("Hi")
 
         # Should sleep with the custom speed
-        mock_sleep.assert_has_calls([call(custom_speed), call(custom_speed)])
+        assert mock_sleep.call_args_list == [call(custom_speed), call(custom_speed)]
 
-    @patch("pynput.keyboard.Controller")
-    def test_multiple_operations(self, mock_controller):
+    def test_multiple_operations(self, handler, mock_keyboard):
         """Test multiple operations in sequence."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        from pynput import keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-
         handler.type_text_fast("Hello")
         handler.add_space()
         handler.type_text_fast("World")
         handler.add_newline()
 
-        # Verify all operations
-        assert mock_keyboard.type.call_count == 2
-        mock_keyboard.type.assert_any_call("Hello")
-        mock_keyboard.type.assert_any_call("World")
-
-        # Should have pressed space and enter
-        mock_keyboard.press.assert_any_call(keyboard.Key.space)
-        mock_keyboard.press.assert_any_call(keyboard.Key.enter)
-        assert mock_keyboard.press.call_count == 2
-        assert mock_keyboard.release.call_count == 2
-
-    @patch("pynput.keyboard.Controller")
-    def test_text_with_special_characters(self, mock_controller):
-        """Test typing text with special characters."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        special_text = "Hello! @#$%^&*() 123"
-
-        handler.type_text_fast(special_text)
-
-        mock_keyboard.type.assert_called_once_with(special_text)
-
-    @patch("pynput.keyboard.Controller")
-    def test_text_with_unicode(self, mock_controller):
-        """Test typing text with unicode characters."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        unicode_text = "Héllo Wörld 🌍"
-
-        handler.type_text_fast(unicode_text)
-
-        mock_keyboard.type.assert_called_once_with(unicode_text)
-
-    @patch("time.sleep")
-    @patch("pynput.keyboard.Controller")
-    def test_no_sleep_on_fast_typing(self, mock_controller, mock_sleep):
-        """Test that type_text_fast doesn't call sleep."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
-        handler.type_text_fast("Hello World")
-
-        # Should not call sleep for fast typing
-        mock_sleep.assert_not_called()
-
-    @patch("pynput.keyboard.Controller")
-    def test_press_key_with_different_keys(self, mock_controller):
-        """Test press_key with various key types."""
-        mock_keyboard = Mock()
-        mock_controller.return_value = mock_keyboard
-
-        from pynput import keyboard
-
-        handler = KeystrokeHandler(backend=DisplayBackend.X11)
+        # Verify every operation, in order
+        assert mock_keyboard.mock_calls == [
+            call.type("Hello"),
+            call.press(keyboard.Key.space),
+            call.release(keyboard.Key.space),
+            call.type("World"),
+            call.press(keyboard.Key.enter),
+            call.release(keyboard.Key.enter),
+        ]
 
-        # Test different key types
-        keys_to_test = [
+    @pytest.mark.parametrize(
+        "key",
+        [
             keyboard.Key.enter,
             keyboard.Key.space,
             keyboard.Key.tab,
             keyboard.Key.esc,
             "a",  # Character key
-        ]
-
-        for key in keys_to_test:
-            mock_keyboard.reset_mock()
-            handler.press_key(key)
+        ],
+    )
+    def test_press_key_with_different_keys(self, handler, mock_keyboard, key):
+        """Test press_key with various key types."""
+        handler.press_key(key)
 
-            mock_keyboard.press.assert_called_once()
-            mock_keyboard.release.assert_called_once()
+        mock_keyboard.press.assert_called_once_with(key)
+        mock_keyboard.release.assert_called_once_with(key)
 
 
 class TestWtypeKeystrokeBackend:
     """Test WtypeKeystrokeBackend (Wayland)."""
 
-    @patch("subprocess.run")
     def test_type_text_fast(self, mock_run):
         """Test fast text typing via wtype."""
         handler = KeystrokeHandler(backend=DisplayBackend.WAYLAND)
@@ -355,7 +200,6 @@ class TestWtypeKeystrokeBackend:
 
         mock_run.assert_called_once_with(["wtype", "--", "Hello World"], check=True)
 
-    @patch("subprocess.run")
     def test_type_text_fast_with_configured_delay(self, mock_run):
         """Test fast text typing with configured delay via wtype."""
         handler = KeystrokeHandler(
@@ -367,7 +211,6 @@ class TestWtypeKeystrokeBackend:
             ["wtype", "-d", "5", "--", "Hello World"], check=True
         )
 
-    @patch("subprocess.run")
     def test_type_text_with_delay(self, mock_run):
         """Test text typing with delay via wtype."""
         handler = KeystrokeHandler(typing_speed=0.05, backend=DisplayBackend.WAYLAND)
@@ -377,7 +220,6 @@ class TestWtypeKeystrokeBackend:
             ["wtype", "-d", "50", "--", "Hello"], check=True
         )
 
-    @patch("subprocess.run")
     def test_add_space(self, mock_run):
         """Test add_space via wtype."""
         handler = KeystrokeHandler(backend=DisplayBackend.WAYLAND)
@@ -385,7 +227,6 @@ class TestWtypeKeystrokeBackend:
 
         mock_run.assert_called_once_with(["wtype", "-k", "space"], check=True)
 
-    @patch("subprocess.run")
     def test_add_newline(self, mock_run):
         """Test add_newline via wtype."""
         handler = KeystrokeHandler(backend=DisplayBackend.WAYLAND)
@@ -393,14 +234,12 @@ class TestWtypeKeystrokeBackend:
 
         mock_run.assert_called_once_with(["wtype", "-k", "Return"], check=True)
 
-    @patch("subprocess.run")
     def test_type_text_empty(self, mock_run):
         """Test that empty text doesn't call wtype."""
         handler = KeystrokeHandler(backend=DisplayBackend.WAYLAND)
         handler.type_text("")
         mock_run.assert_not_called()
 
-    @patch("subprocess.run")
     def test_type_text_fast_with_trailing_space(self, mock_run):
         """Test fast typing with trailing space via wtype."""
         handler = KeystrokeHandler(backend=DisplayBackend.WAYLAND)
@@ -410,7 +249,6 @@ class TestWtypeKeystrokeBackend:
         mock_run.assert_any_call(["wtype", "--", "Hello"], check=True)
         mock_run.assert_any_call(["wtype", "-k", "space"], check=True)
 
-    @patch("subprocess.run")
     def test_press_key_string(self, mock_run):
         """Test pressing a named key via wtype."""
         handler = KeystrokeHandler(backend=DisplayBackend.WAYLAND)
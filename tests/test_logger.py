@@ -1,45 +1,77 @@
 """Test logger functionality."""
 
-import io
-import tempfile
-from pathlib import Path
+import re
 
+import pytest
+
+from whisper_to_me import logger as logger_module
 from whisper_to_me.logger import Logger, LogLevel, get_logger, setup_logger
 
+_TIMESTAMP_RE = re.compile(r"\[\d{2}:\d{2}:\d{2}\]")
+
+
+class _Capture:
+    """Text sink that keeps each write and joins them only when read."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text):
+        self.parts.append(text)
+        return len(text)
+
+    def getvalue(self):
+        return "".join(self.parts)
+
+
+@pytest.fixture(autouse=True)
+def reset_global_logger(monkeypatch):
+    """Start each test without a global logger and restore it afterwards."""
+    monkeypatch.setattr(logger_module, "_global_logger", None)
+
+
+@pytest.fixture
+def output_stream():
+    """Capture console output for a logger under test."""
+    return _Capture()
+
+
+@pytest.fixture
+def debug_logger(output_stream):
+    """Create a DEBUG-level logger with categories and no timestamps."""
+    return Logger(
+        min_level=LogLevel.DEBUG,
+        output_stream=output_stream,
+        include_timestamps=False,
+        include_categories=True,
+    )
+
 
 class TestLogger:
     """Test cases for logger functionality."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        self.output_stream = io.StringIO()
-        self.logger = Logger(
-            min_level=LogLevel.DEBUG,
-            output_stream=self.output_stream,
-            include_timestamps=False,
-            include_categories=True,
-        )
-
-    def test_log_levels(self):
+    def test_log_levels(self, debug_logger, output_stream):
         """Test different log levels."""
-        self.logger.debug("Debug message")
-        self.logger.info("Info message")
-        self.logger.warning("Warning message")
-        self.logger.error("Error message")
-        self.logger.critical("Critical message")
+        debug_logger.debug("Debug message")
+        debug_logger.info("Info message")
+        debug_logger.warning("Warning message")
+        debug_logger.error("Error message")
+        debug_logger.critical("Critical message")
 
-        output = self.output_stream.getvalue()
+        output = output_stream.getvalue()
         assert "🐛 Debug message" in output  # No level in default format
         assert "ℹ️ Info message" in output
         assert "⚠️ Warning message" in output
         assert "❌ Error message" in output
         assert "❌ Critical message" in output
 
-    def test_log_level_filtering(self):
+    def test_log_level_filtering(self, output_stream):
         """Test that log level filtering works."""
         logger = Logger(
             min_level=LogLevel.WARNING,
-            output_stream=self.output_stream,
+            output_stream=output_stream,
             include_timestamps=False,
         )
 
@@ -48,49 +80,49 @@ class TestLogger:
         logger.warning("Should appear")
         logger.error("Should appear")
 
-        output = self.output_stream.getvalue()
+        output = output_stream.getvalue()
         assert "Should not appear" not in output
         assert "Should appear" in output
 
-    def test_custom_icons(self):
+    def test_custom_icons(self, debug_logger, output_stream):
         """Test custom icon usage."""
-        self.logger.log(LogLevel.INFO, "Test message", icon="success")
-        self.logger.log(LogLevel.INFO, "Test message", icon="device")
-        self.logger.log(LogLevel.INFO, "Test message", icon="🚀")  # Direct emoji
+        debug_logger.log(LogLevel.INFO, "Test message", icon="success")
+        debug_logger.log(LogLevel.INFO, "Test message", icon="device")
+        debug_logger.log(LogLevel.INFO, "Test message", icon="🚀")  # Direct emoji
 
-        output = self.output_stream.getvalue()
+        output = output_stream.getvalue()
         assert "✓" in output  # success icon
         assert "📱" in output  # device icon
         assert "🚀" in output  # direct emoji
 
-    def test_categories(self):
+    def test_categories(self, debug_logger, output_stream):
         """Test category inclusion."""
-        self.logger.info("Test message", category="audio")
-        self.logger.error("Error message", category="config")
+        debug_logger.info("Test message", category="audio")
+        debug_logger.error("Error message", category="config")
 
-        output = self.output_stream.getvalue()
+        output = output_stream.getvalue()
         assert "[AUDIO]" in output
         assert "[CONFIG]" in output
 
-    def test_no_categories(self):
+    def test_no_categories(self, output_stream):
         """Test logger without categories."""
-        logger = Logger(output_stream=self.output_stream, include_categories=False)
+        logger = Logger(output_stream=output_stream, include_categories=False)
 
         logger.info("Test message", category="audio")
-        output = self.output_stream.getvalue()
+        output = output_stream.getvalue()
         assert "[AUDIO]" not in output
         assert "Test message" in output
 
-    def test_specialized_logging_methods(self):
+    def test_specialized_logging_methods(self, debug_logger, output_stream):
         """Test specialized logging methods."""
-        self.logger.success("Operation completed")
-        self.logger.recording_started()
-        self.logger.recording_stopped(2.5, 1024)
-        self.logger.transcription_completed("Hello world", "en", 0.95)
-        self.logger.device_switched("Test Device")
-        self.logger.profile_switched("work")
-
-        output = self.output_stream.getvalue()
+        debug_logger.success("Operation completed")
+        debug_logger.recording_started()
+        debug_logger.recording_stopped(2.5, 1024)
+        debug_logger.transcription_completed("Hello world", "en", 0.95)
+        debug_logger.device_switched("Test Device")
+        debug_logger.profile_switched("work")
+
+        output = output_stream.getvalue()
         assert "✓" in output  # success icon
         assert "🎤" in output  # recording icon
         assert "🔄" in output  # processing icon
@@ -104,43 +136,41 @@ class TestLogger:
         assert "Test Device" in output
         assert "work" in output
 
-    def test_file_logging(self):
+    def test_file_logging(self, output_stream, tmp_path):
         """Test logging to file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = Path(temp_dir) / "test.log"
+        log_file = tmp_path / "test.log"
+        log_file.write_text("existing line\n", encoding="utf-8")
 
-            logger = Logger(
-                output_stream=self.output_stream,
-                log_file=log_file,
-                include_timestamps=False,
-            )
+        logger = Logger(
+            output_stream=output_stream,
+            log_file=log_file,
+            include_timestamps=False,
+        )
 
-            logger.info("Test message")
+        logger.info("Test message")
 
-            # Check console output
-            assert "Test message" in self.output_stream.getvalue()
+        # Check console output
+        assert "Test message" in output_stream.getvalue()
 
-            # Check file output
-            assert log_file.exists()
-            with open(log_file, encoding="utf-8") as f:
-                file_content = f.read()
-            assert "Test message" in file_content
+        # Check file output is appended after what was already there
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "existing line"
+        assert len(lines) == 2
+        assert "Test message" in lines[1]
 
-    def test_timestamps(self):
+    def test_timestamps(self, output_stream):
         """Test timestamp inclusion."""
         logger = Logger(
-            output_stream=self.output_stream,
+            output_stream=output_stream,
             include_timestamps=True,
             include_categories=False,
         )
 
         logger.info("Test message")
-        output = self.output_stream.getvalue()
+        output = output_stream.getvalue()
 
         # Should contain timestamp pattern [HH:MM:SS]
-        import re
-
-        assert re.search(r"\[\d{2}:\d{2}:\d{2}\]", output)
+        assert _TIMESTAMP_RE.search(output)
 
     def test_global_logger_functions(self):
         """Test global logger functions."""
@@ -150,7 +180,7 @@ class TestLogger:
         assert logger1 is logger2  # Should be the same instance
 
         # Test setting up global logger
-        output_stream = io.StringIO()
+        output_stream = _Capture()
         setup_logger(min_level=LogLevel.ERROR, output_stream=output_stream)
 
         global_logger = get_logger()
@@ -161,15 +191,15 @@ class TestLogger:
         assert "Should not appear" not in output
         assert "Should appear" in output
 
-    def test_model_and_startup_logging(self):
+    def test_model_and_startup_logging(self, debug_logger, output_stream):
         """Test specialized startup and model logging."""
-        self.logger.model_loaded("large-v3", "cuda")
-        self.logger.application_startup("default")
-        self.logger.hotkey_info("<scroll_lock>", "push-to-talk")
-        self.logger.hotkey_info("<caps_lock>", "tap-mode", "<esc>")
-        self.logger.application_shutdown()
+        debug_logger.model_loaded("large-v3", "cuda")
+        debug_logger.application_startup("default")
+        debug_logger.hotkey_info("<scroll_lock>", "push-to-talk")
+        debug_logger.hotkey_info("<caps_lock>", "tap-mode", "<esc>")
+        debug_logger.application_shutdown()
 
-        output = self.output_stream.getvalue()
+        output = output_stream.getvalue()
         assert "🧠" in output  # model icon
         assert "🚀" in output  # startup icon
         assert "⌨️" in output  # key icon
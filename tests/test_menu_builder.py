@@ -1,6 +1,8 @@
 """Test menu builder functionality."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call
+
+import pytest
 
 from whisper_to_me.menu_builder import (
     DeviceMenuFormatter,
@@ -9,6 +11,16 @@ from whisper_to_me.menu_builder import (
     TrayMenuBuilder,
 )
 
+# Every test runs against the mocked pystray module, even those that never
+# assert on it, so no test can reach the real tray backend
+pytestmark = pytest.mark.usefixtures("mock_pystray")
+
+# Handlers are only passed through to pystray, so identity is all that matters
+_HANDLER = object()
+
+# Nested menu items are likewise only forwarded, so one shared pool serves all tests
+_ITEMS = (object(), object())
+
 
 class TestMenuBuilder:
     """Test MenuBuilder functionality."""
@@ -21,95 +33,90 @@ class TestMenuBuilder:
         """Test MenuBuilder initialization."""
         assert self.builder.menu_items == []
 
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_add_header(self, mock_pystray):
-        """Test add_header method."""
-        self.builder.add_header("Test Header", enabled=True)
-
-        assert len(self.builder.menu_items) == 1
-        mock_pystray.MenuItem.assert_called_once_with("Test Header", None, enabled=True)
-
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_add_header_default_disabled(self, mock_pystray):
-        """Test add_header with default enabled=False."""
-        self.builder.add_header("Test Header")
-
-        assert len(self.builder.menu_items) == 1
-        mock_pystray.MenuItem.assert_called_once_with(
-            "Test Header", None, enabled=False
-        )
-
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_add_default_header(self, mock_pystray):
-        """Test add_default_header method."""
-        self.builder.add_default_header("Default Header")
-
-        assert len(self.builder.menu_items) == 1
-        mock_pystray.MenuItem.assert_called_once_with(
-            "Default Header", None, default=True, enabled=False
-        )
-
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_add_info_item(self, mock_pystray):
-        """Test add_info_item method."""
-        self.builder.add_info_item("Info text")
-
-        assert len(self.builder.menu_items) == 1
-        mock_pystray.MenuItem.assert_called_once_with("Info text", None, enabled=False)
-
-    @patch("whisper_to_me.menu_builder.pystray.Menu")
-    def test_add_separator(self, mock_menu):
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs", "expected"),
+        [
+            pytest.param(
+                "add_header",
+                ("Test Header",),
+                {"enabled": True},
+                call("Test Header", None, enabled=True),
+                id="header",
+            ),
+            pytest.param(
+                "add_header",
+                ("Test Header",),
+                {},
+                call("Test Header", None, enabled=False),
+                id="header-default-disabled",
+            ),
+            pytest.param(
+                "add_default_header",
+                ("Default Header",),
+                {},
+                call("Default Header", None, default=True, enabled=False),
+                id="default-header",
+            ),
+            pytest.param(
+                "add_info_item",
+                ("Info text",),
+                {},
+                call("Info text", None, enabled=False),
+                id="info-item",
+            ),
+            pytest.param(
+                "add_action_item",
+                ("Action", _HANDLER),
+                {},
+                call("Action", _HANDLER),
+                id="action-item",
+            ),
+        ],
+    )
+    def test_add_menu_item(self, mock_pystray, method, args, kwargs, expected):
+        """Test that each add_* helper appends exactly one configured MenuItem."""
+        getattr(self.builder, method)(*args, **kwargs)
+
+        assert self.builder.menu_items == [mock_pystray.MenuItem.return_value]
+        assert mock_pystray.MenuItem.call_args_list == [expected]
+
+    def test_add_separator(self, mock_pystray):
         """Test add_separator method."""
-        mock_menu.SEPARATOR = "SEPARATOR"
-
         self.builder.add_separator()
 
-        assert len(self.builder.menu_items) == 1
-        assert self.builder.menu_items[0] == "SEPARATOR"
-
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_add_action_item(self, mock_pystray):
-        """Test add_action_item method."""
-        mock_handler = Mock()
-
-        self.builder.add_action_item("Action", mock_handler)
-
-        assert len(self.builder.menu_items) == 1
-        mock_pystray.MenuItem.assert_called_once_with("Action", mock_handler)
+        assert self.builder.menu_items == ["SEPARATOR"]
 
-    @patch("whisper_to_me.menu_builder.pystray")
     def test_add_submenu(self, mock_pystray):
         """Test add_submenu method."""
-        submenu_items = [Mock(), Mock()]
+        submenu_items = list(_ITEMS)
 
         self.builder.add_submenu("Submenu", submenu_items)
 
         assert len(self.builder.menu_items) == 1
-        mock_pystray.MenuItem.assert_called_once()
-        # Check that Menu was created with submenu items
+        # The submenu wraps a Menu created from the nested items
         mock_pystray.Menu.assert_called_once_with(*submenu_items)
+        mock_pystray.MenuItem.assert_called_once_with(
+            "Submenu", mock_pystray.Menu.return_value
+        )
 
-    @patch("whisper_to_me.menu_builder.pystray")
     def test_build(self, mock_pystray):
         """Test build method."""
-        # Add some items
-        mock_pystray.Menu.SEPARATOR = "SEPARATOR"
         self.builder.add_header("Header")
         self.builder.add_separator()
-        self.builder.add_action_item("Action", Mock())
+        self.builder.add_action_item("Action", _HANDLER)
 
-        self.builder.build()
+        menu = self.builder.build()
 
-        # Should create Menu with all items
-        assert mock_pystray.Menu.called
+        # Should create Menu with all items, in order
         assert len(self.builder.menu_items) == 3
+        mock_pystray.Menu.assert_called_once_with(*self.builder.menu_items)
+        assert menu is mock_pystray.Menu.return_value
 
-    @patch("whisper_to_me.menu_builder.pystray")
     def test_clear(self, mock_pystray):
         """Test clear method."""
         # Add some items
         self.builder.add_header("Header")
-        self.builder.add_action_item("Action", Mock())
+        self.builder.add_action_item("Action", _HANDLER)
 
         assert len(self.builder.menu_items) == 2
 
@@ -126,7 +133,7 @@ class TestProfileMenuFormatter:
         """Test ProfileMenuFormatter initialization."""
         get_profiles = Mock(return_value=["default", "work"])
         get_current = Mock(return_value="default")
-        handler = Mock()
+        handler = _HANDLER
 
         formatter = ProfileMenuFormatter(get_profiles, get_current, handler)
 
@@ -134,12 +141,11 @@ class TestProfileMenuFormatter:
         assert formatter.get_current_profile == get_current
         assert formatter.profile_switch_handler == handler
 
-    @patch("whisper_to_me.menu_builder.pystray")
     def test_create_profile_menu_items_single_profile(self, mock_pystray):
         """Test menu creation with single profile."""
         get_profiles = Mock(return_value=["default"])
         get_current = Mock(return_value="default")
-        handler = Mock()
+        handler = _HANDLER
 
         formatter = ProfileMenuFormatter(get_profiles, get_current, handler)
         result = formatter.create_profile_menu_items()
@@ -147,7 +153,6 @@ class TestProfileMenuFormatter:
         # Should return empty list for single profile
         assert result == []
 
-    @patch("whisper_to_me.menu_builder.pystray")
     def test_create_profile_menu_items_multiple_profiles(self, mock_pystray):
         """Test menu creation with multiple profiles."""
         profiles = ["default", "work", "gaming"]
@@ -155,7 +160,7 @@ class TestProfileMenuFormatter:
         get_current = Mock(return_value="work")
 
         # Create handler that returns different functions for each profile
-        handlers = {profile: Mock(name=f"handler_{profile}") for profile in profiles}
+        handlers = {profile: object() for profile in profiles}
 
         def handler(p):
             return handlers[p]
@@ -181,7 +186,7 @@ class TestDeviceMenuFormatter:
         """Test DeviceMenuFormatter initialization."""
         get_devices = Mock(return_value=[])
         get_current = Mock(return_value=None)
-        handler = Mock()
+        handler = _HANDLER
 
         formatter = DeviceMenuFormatter(get_devices, get_current, handler)
 
@@ -189,12 +194,11 @@ class TestDeviceMenuFormatter:
         assert formatter.get_current_device == get_current
         assert formatter.device_switch_handler == handler
 
-    @patch("whisper_to_me.menu_builder.pystray")
     def test_create_device_menu_items_no_devices(self, mock_pystray):
         """Test menu creation with no devices."""
         get_devices = Mock(return_value=[])
         get_current = Mock(return_value=None)
-        handler = Mock()
+        handler = _HANDLER
 
         formatter = DeviceMenuFormatter(get_devices, get_current, handler)
         result = formatter.create_device_menu_items()
@@ -202,13 +206,12 @@ class TestDeviceMenuFormatter:
         # Should return empty list for no devices
         assert result == []
 
-    @patch("whisper_to_me.menu_builder.pystray")
     def test_create_device_menu_items_single_device(self, mock_pystray):
         """Test menu creation with single device."""
         device = {"id": 1, "name": "USB Mic", "hostapi_name": "ALSA"}
         get_devices = Mock(return_value=[device])
         get_current = Mock(return_value=device)
-        handler = Mock()
+        handler = _HANDLER
 
         formatter = DeviceMenuFormatter(get_devices, get_current, handler)
         result = formatter.create_device_menu_items()
@@ -246,73 +249,94 @@ class TestTrayMenuBuilder:
 
         assert builder.device_formatter == formatter
 
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_build_complete_menu_basic(self, mock_pystray):
-        """Test building complete menu with basic info."""
-        mock_pystray.Menu.SEPARATOR = "SEPARATOR"
-
-        builder = TrayMenuBuilder()
-        on_quit = Mock()
-
-        builder.build_complete_menu(
-            current_profile="default", current_device=None, on_quit=on_quit
-        )
-
-        # Should have created menu with header and quit
-        assert mock_pystray.Menu.called
-        assert mock_pystray.MenuItem.call_count >= 3  # Header, profile info, quit
-
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_build_complete_menu_with_device(self, mock_pystray):
-        """Test building menu with device info."""
-        mock_pystray.Menu.SEPARATOR = "SEPARATOR"
-
+    @pytest.mark.parametrize(
+        ("profile", "device", "profile_items", "device_items", "expected_labels"),
+        [
+            pytest.param(
+                "default",
+                None,
+                None,
+                None,
+                ["Whisper-to-Me", "Profile: default", "Quit"],
+                id="basic",
+            ),
+            pytest.param(
+                "default",
+                {"name": "USB Microphone", "id": 1},
+                None,
+                None,
+                [
+                    "Whisper-to-Me",
+                    "Profile: default",
+                    "Device: USB Microphone",
+                    "Quit",
+                ],
+                id="with-device",
+            ),
+            pytest.param(
+                "default",
+                {"name": "A" * 40},
+                None,
+                None,
+                [
+                    "Whisper-to-Me",
+                    "Profile: default",
+                    f"Device: {'A' * 27}...",
+                    "Quit",
+                ],
+                id="long-device-name",
+            ),
+            pytest.param(
+                "work",
+                None,
+                [],
+                [],
+                ["Whisper-to-Me", "Profile: work", "Quit"],
+                id="empty-formatters",
+            ),
+            pytest.param(
+                "work",
+                {"name": "Test Device"},
+                list(_ITEMS),
+                list(_ITEMS),
+                [
+                    "Whisper-to-Me",
+                    "Profile: work",
+                    "Device: Test Device",
+                    "Switch Profile",
+                    "Select Audio Device",
+                    "Quit",
+                ],
+                id="with-formatters",
+            ),
+        ],
+    )
+    def test_build_complete_menu(
+        self,
+        mock_pystray,
+        profile,
+        device,
+        profile_items,
+        device_items,
+        expected_labels,
+    ):
+        """Test the menu sections produced for each tray state."""
         builder = TrayMenuBuilder()
-        device = {"name": "USB Microphone", "id": 1}
-
-        builder.build_complete_menu(
-            current_profile="default", current_device=device, on_quit=Mock()
-        )
-
-        # Should include device info
-        info_calls = [
-            call
-            for call in mock_pystray.MenuItem.call_args_list
-            if "Device: USB Microphone" in str(call)
-        ]
-        assert len(info_calls) > 0
-
-    @patch("whisper_to_me.menu_builder.pystray")
-    def test_build_complete_menu_with_formatters(self, mock_pystray):
-        """Test building menu with profile and device formatters."""
-        mock_pystray.Menu.SEPARATOR = "SEPARATOR"
-
-        builder = TrayMenuBuilder()
-
-        # Set up profile formatter
-        profile_formatter = Mock(spec=ProfileMenuFormatter)
-        profile_formatter.create_profile_menu_items.return_value = [Mock(), Mock()]
-        builder.set_profile_formatter(profile_formatter)
-
-        # Set up device formatter
-        device_formatter = Mock(spec=DeviceMenuFormatter)
-        device_formatter.create_device_menu_items.return_value = [Mock(), Mock()]
-        builder.set_device_formatter(device_formatter)
 
-        builder.build_complete_menu(
-            current_profile="work",
-            current_device={"name": "Test Device"},
-            on_quit=Mock(),
+        # A formatter is only installed when the row provides its items
+        if profile_items is not None:
+            profile_formatter = Mock(spec=ProfileMenuFormatter)
+            profile_formatter.create_profile_menu_items.return_value = profile_items
+            builder.set_profile_formatter(profile_formatter)
+        if device_items is not None:
+            device_formatter = Mock(spec=DeviceMenuFormatter)
+            device_formatter.create_device_menu_items.return_value = device_items
+            builder.set_device_formatter(device_formatter)
+
+        menu = builder.build_complete_menu(
+            current_profile=profile, current_device=device, on_quit=_HANDLER
         )
 
-        # Should have called formatters
-        profile_formatter.create_profile_menu_items.assert_called_once()
-        device_formatter.create_device_menu_items.assert_called_once()
-
-        # Should have created submenus
-        submenu_calls = [
-            call
-            for call in mock_pystray.MenuItem.call_args_list
-            if "Switch Profile" in str(call) or "Select Audio Device" in str(call)
-        ]
-        assert len(submenu_calls) == 2
+        labels = [c.args[0] for c in mock_pystray.MenuItem.call_args_list]
+        assert labels == expected_labels
+        assert menu is mock_pystray.Menu.return_value
@@ -2,34 +2,68 @@
 
 import os
 import shutil
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
-from whisper_to_me.config import (
-    AdvancedConfig,
-    AppConfig,
-    ConfigManager,
-    GeneralConfig,
-    ProcessingConfig,
-    RecordingConfig,
-    UIConfig,
-)
+from tests.conftest import make_app_config
 from whisper_to_me.component_factory import ComponentFactory
+from whisper_to_me.config import ConfigManager
 from whisper_to_me.profile_manager import ProfileManager
-from whisper_to_me.speech_processor import SpeechProcessor
+
+# Profiles seeded into every test's config file
+_WORK_CONFIG = make_app_config(
+    general={"language": "fr", "debug": True},
+    recording={
+        "mode": "tap-mode",
+        "trigger_key": "<caps_lock>",
+        "discard_key": "delete",
+    },
+    ui={"use_tray": False},
+    advanced={"chunk_size": 1024, "vad_filter": False},
+)
+
+_GAMING_CONFIG = make_app_config(
+    general={"model": "tiny", "device": "cpu", "language": "en"},
+    recording={"trigger_key": "<f9>", "discard_key": "esc"},
+)
+
+# Expected get_profile_summary() fields, without the name
+_WORK_SUMMARY = {
+    "model": "large-v3",
+    "device": "cuda",
+    "language": "fr",
+    "mode": "tap-mode",
+    "trigger_key": "<caps_lock>",
+}
+
+_DEFAULT_SUMMARY = {
+    "model": "large-v3",
+    "device": "cuda",
+    "language": "auto",
+    "mode": "push-to-talk",
+    "trigger_key": "<scroll_lock>",
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_config_file(tmp_path_factory):
+    """Write a config file with the work and gaming profiles once per module."""
+    config_file = tmp_path_factory.mktemp("profiles") / "test_config.toml"
+    config_manager = ConfigManager(config_file=str(config_file))
+    config_manager.create_profile("work", _WORK_CONFIG)
+    config_manager.create_profile("gaming", _GAMING_CONFIG)
+    return config_file
 
 
 class TestProfileManager:
     """Test ProfileManager functionality."""
 
-    def setup_method(self):
-        """Set up test environment with real config files."""
-        # Create temporary directory for config
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.temp_dir) / "test_config.toml"
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, seeded_config_file):
+        """Set up test environment with a private copy of the seeded config."""
+        self.config_file = tmp_path / "test_config.toml"
+        shutil.copyfile(seeded_config_file, self.config_file)
 
         # Create real ConfigManager with custom config file
         self.config_manager = ConfigManager(config_file=str(self.config_file))
@@ -50,70 +84,12 @@ class TestProfileManager:
             self.config_manager, self.component_factory, self.on_config_changed
         )
 
-        # Create test profiles
-        self._create_test_profiles()
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def _create_test_profiles(self):
-        """Create test profiles in the config."""
-        # Create work profile
-        work_config = AppConfig(
-            general=GeneralConfig(
-                model="large-v3",
-                device="cuda",
-                language="fr",
-                debug=True,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="tap-mode",
-                trigger_key="<caps_lock>",
-                discard_key="delete",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=False),
-            advanced=AdvancedConfig(
-                chunk_size=1024,
-                vad_filter=False,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
-        )
-        self.config_manager.create_profile("work", work_config)
-
-        # Create gaming profile
-        gaming_config = AppConfig(
-            general=GeneralConfig(
-                model="tiny",
-                device="cpu",
-                language="en",
-                debug=False,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="push-to-talk",
-                trigger_key="<f9>",
-                discard_key="esc",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=True),
-            advanced=AdvancedConfig(
-                chunk_size=512,
-                vad_filter=True,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+    @pytest.fixture
+    def no_model_reload(self, monkeypatch):
+        """Skip speech processor recreation when switching profiles."""
+        monkeypatch.setattr(
+            self.component_factory, "recreate_speech_processor", lambda old, new: None
         )
-        self.config_manager.create_profile("gaming", gaming_config)
 
     def test_init(self):
         """Test ProfileManager initialization."""
@@ -123,13 +99,10 @@ class TestProfileManager:
         assert self.manager.current_config is None
         assert self.manager.logger is not None
 
+    @pytest.mark.usefixtures("no_model_reload")
     def test_switch_profile_success(self):
         """Test successful profile switching."""
-        # Mock only the speech processor recreation
-        with patch.object(
-            self.component_factory, "recreate_speech_processor", return_value=None
-        ):
-            result = self.manager.switch_profile("work")
+        result = self.manager.switch_profile("work")
 
         # Verify the switch was successful
         assert result.general.model == "large-v3"
@@ -147,79 +120,71 @@ class TestProfileManager:
 
     def test_switch_profile_invalid_profile(self):
         """Test switching to invalid profile."""
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(
+            ValueError, match="Profile 'nonexistent' not found. Available:"
+        ) as exc_info:
             self.manager.switch_profile("nonexistent")
 
-        assert "Profile 'nonexistent' not found" in str(exc_info.value)
         # Check that available profiles are listed
-        assert "Available:" in str(exc_info.value)
-        assert "default" in str(exc_info.value)
-        assert "gaming" in str(exc_info.value)
-        assert "work" in str(exc_info.value)
+        message = str(exc_info.value)
+        assert all(name in message for name in ("default", "gaming", "work"))
 
         # Should not call callback on failure
         self.on_config_changed.assert_not_called()
 
-    def test_switch_profile_with_speech_processor_recreation(self):
+    def test_switch_profile_with_speech_processor_recreation(self, monkeypatch):
         """Test profile switch that requires speech processor recreation."""
-        # Create a mock speech processor
-        new_speech_processor = Mock(spec=SpeechProcessor)
+        # The new processor is only passed through, so a sentinel is enough
+        new_speech_processor = object()
 
         # Set speech processor changed callback
         speech_callback = Mock()
         self.manager.set_speech_processor_changed_callback(speech_callback)
 
         # Mock the recreation to return a new processor
-        with patch.object(
-            self.component_factory,
-            "recreate_speech_processor",
-            return_value=new_speech_processor,
-        ) as mock_recreate:
-            self.manager.switch_profile("work")
+        mock_recreate = Mock(return_value=new_speech_processor)
+        monkeypatch.setattr(
+            self.component_factory, "recreate_speech_processor", mock_recreate
+        )
+        result = self.manager.switch_profile("work")
 
         # Should recreate speech processor with old and new configs
         mock_recreate.assert_called_once()
-        call_args = mock_recreate.call_args[0]
-        assert call_args[0].general.model == "large-v3"  # default config
-        assert call_args[1].general.model == "large-v3"  # work config
+        old_config, new_config = mock_recreate.call_args.args
+        assert new_config is result
+        assert old_config.general.language == "auto"  # default config
 
         # Should call speech processor callback
         speech_callback.assert_called_once_with(new_speech_processor)
 
+    @pytest.mark.usefixtures("no_model_reload")
     def test_switch_profile_no_old_config(self):
         """Test profile switch when no current config exists."""
         self.manager.current_config = None
 
-        with patch.object(
-            self.component_factory, "recreate_speech_processor", return_value=None
-        ):
-            self.manager.switch_profile("work")
+        self.manager.switch_profile("work")
 
         # Should load current config for comparison
         assert self.manager.current_config.general.model == "large-v3"
 
+    @pytest.mark.usefixtures("no_model_reload")
     def test_switch_profile_no_config_changed_callback(self):
         """Test profile switch without config changed callback."""
         # Create manager without callback
         manager = ProfileManager(self.config_manager, self.component_factory, None)
 
-        with patch.object(
-            self.component_factory, "recreate_speech_processor", return_value=None
-        ):
-            # Should not raise exception
-            result = manager.switch_profile("work")
-            assert result.general.model == "large-v3"
+        # Should not raise exception
+        result = manager.switch_profile("work")
+        assert result.general.model == "large-v3"
 
+    @pytest.mark.usefixtures("no_model_reload")
     def test_get_current_profile_name(self):
         """Test get_current_profile_name method."""
         # Initially should be default
         assert self.manager.get_current_profile_name() == "default"
 
         # Switch profile
-        with patch.object(
-            self.component_factory, "recreate_speech_processor", return_value=None
-        ):
-            self.manager.switch_profile("gaming")
+        self.manager.switch_profile("gaming")
 
         # Should return new profile
         assert self.manager.get_current_profile_name() == "gaming"
@@ -236,30 +201,9 @@ class TestProfileManager:
 
     def test_create_profile_success(self):
         """Test successful profile creation."""
-        new_config = AppConfig(
-            general=GeneralConfig(
-                model="small",
-                device="cpu",
-                language="de",
-                debug=False,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="push-to-talk",
-                trigger_key="<f12>",
-                discard_key="esc",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=True),
-            advanced=AdvancedConfig(
-                chunk_size=512,
-                vad_filter=True,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+        new_config = make_app_config(
+            general={"model": "small", "device": "cpu", "language": "de"},
+            recording={"trigger_key": "<f12>", "discard_key": "esc"},
         )
 
         result = self.manager.create_profile("german", new_config)
@@ -286,27 +230,29 @@ class TestProfileManager:
         # Restore permissions
         os.chmod(self.config_file, 0o644)
 
-    def test_delete_profile_success(self):
-        """Test successful profile deletion."""
-        result = self.manager.delete_profile("gaming")
-
-        assert result is True
-        assert "gaming" not in self.config_manager.get_profile_names()
-
-    def test_delete_profile_default(self):
-        """Test that default profile cannot be deleted."""
-        result = self.manager.delete_profile("default")
-
-        assert result is False
-        assert "default" in self.config_manager.get_profile_names()
-
+    @pytest.mark.parametrize(
+        ("name", "deleted"),
+        [
+            pytest.param("gaming", True, id="existing"),
+            pytest.param("default", False, id="default-protected"),
+            pytest.param("nonexistent", False, id="nonexistent"),
+        ],
+    )
+    def test_delete_profile(self, name, deleted):
+        """Test that only existing, non-default profiles are deleted."""
+        before = self.config_manager.get_profile_names()
+
+        result = self.manager.delete_profile(name)
+
+        assert result is deleted
+        expected = [p for p in before if p != name] if deleted else before
+        assert self.config_manager.get_profile_names() == expected
+
+    @pytest.mark.usefixtures("no_model_reload")
     def test_delete_profile_current_profile(self):
         """Test deleting the current profile."""
         # Switch to gaming profile
-        with patch.object(
-            self.component_factory, "recreate_speech_processor", return_value=None
-        ):
-            self.manager.switch_profile("gaming")
+        self.manager.switch_profile("gaming")
 
         # Delete current profile
         result = self.manager.delete_profile("gaming")
@@ -319,109 +265,55 @@ class TestProfileManager:
             self.on_config_changed.call_count == 2
         )  # Once for switch, once for delete
 
-    def test_delete_profile_nonexistent(self):
-        """Test deleting non-existent profile."""
-        result = self.manager.delete_profile("nonexistent")
-
-        assert result is False
-
-    def test_validate_profile_config_valid(self):
-        """Test validating a valid profile configuration."""
-        config = self.config_manager.load_config()
-
-        result = self.manager.validate_profile_config(config)
-
-        assert result is True
-
-    def test_validate_profile_config_invalid_key(self):
-        """Test validating profile with invalid key combination."""
+    @pytest.mark.parametrize(
+        ("trigger_key", "valid"),
+        [
+            pytest.param(None, True, id="loaded-config"),
+            pytest.param("invalid_key_format", False, id="invalid-trigger-key"),
+        ],
+    )
+    def test_validate_profile_config(self, trigger_key, valid):
+        """Test validating profile configurations by their key combinations."""
         config = self.config_manager.load_config()
-        config.recording.trigger_key = "invalid_key_format"
-
-        result = self.manager.validate_profile_config(config)
-
-        assert result is False
+        if trigger_key is not None:
+            config.recording.trigger_key = trigger_key
+
+        assert self.manager.validate_profile_config(config) is valid
+
+    @pytest.mark.parametrize(
+        ("profile_name", "expected"),
+        [
+            pytest.param("work", _WORK_SUMMARY, id="named"),
+            pytest.param("default", _DEFAULT_SUMMARY, id="default"),
+            # apply_profile falls back to the default config for unknown names
+            pytest.param(
+                "definitely_nonexistent_profile_12345",
+                _DEFAULT_SUMMARY,
+                id="nonexistent",
+            ),
+        ],
+    )
+    def test_get_profile_summary(self, profile_name, expected):
+        """Test profile summaries for named, default and unknown profiles."""
+        summary = self.manager.get_profile_summary(profile_name)
 
-    def test_get_profile_summary_existing(self):
-        """Test getting profile summary for existing profile."""
-        summary = self.manager.get_profile_summary("work")
-
-        assert summary is not None
-        assert summary["name"] == "work"
-        assert summary["model"] == "large-v3"
-        assert summary["device"] == "cuda"
-        assert summary["language"] == "fr"
-        assert summary["mode"] == "tap-mode"
-        assert summary["trigger_key"] == "<caps_lock>"
-
-    def test_get_profile_summary_default(self):
-        """Test getting profile summary for default profile."""
-        summary = self.manager.get_profile_summary("default")
-
-        assert summary is not None
-        assert summary["name"] == "default"
-        assert summary["model"] == "large-v3"
-        assert summary["device"] == "cuda"
-        assert summary["language"] == "auto"
-
-    def test_get_profile_summary_nonexistent(self):
-        """Test getting profile summary for non-existent profile."""
-        # First check what profiles actually exist
-        available_profiles = self.manager.get_available_profiles()
-
-        # Use a profile name that definitely doesn't exist
-        nonexistent_name = "definitely_nonexistent_profile_12345"
-        assert nonexistent_name not in available_profiles
-
-        summary = self.manager.get_profile_summary(nonexistent_name)
-
-        # When profile doesn't exist, apply_profile returns default config
-        # So we get a summary with default values
-        assert summary is not None
-        assert summary["name"] == nonexistent_name
-        # Should have default config values
-        default_summary = self.manager.get_profile_summary("default")
-        assert summary["model"] == default_summary["model"]
-        assert summary["device"] == default_summary["device"]
-        assert summary["language"] == default_summary["language"]
+        assert summary == {"name": profile_name, **expected}
 
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("no_model_reload")
     def test_profile_lifecycle(self):
         """Test complete profile lifecycle: create, switch, delete."""
         # Create profile
-        test_config = AppConfig(
-            general=GeneralConfig(
-                model="base",
-                device="cpu",
-                language="ja",
-                debug=False,
-                last_profile="default",
-            ),
-            recording=RecordingConfig(
-                mode="push-to-talk",
-                trigger_key="<f10>",
-                discard_key="esc",
-                audio_device=None,
-            ),
-            ui=UIConfig(use_tray=True),
-            advanced=AdvancedConfig(
-                chunk_size=512,
-                vad_filter=True,
-                initial_prompt="",
-                min_silence_duration_ms=2000,
-                speech_pad_ms=400,
-            ),
-            processing=ProcessingConfig(),
-            profiles={},
+        test_config = make_app_config(
+            general={"model": "base", "device": "cpu", "language": "ja"},
+            recording={"trigger_key": "<f10>", "discard_key": "esc"},
         )
 
         create_result = self.manager.create_profile("test_lifecycle", test_config)
         assert create_result is True
 
         # Switch to profile
-        with patch.object(
-            self.component_factory, "recreate_speech_processor", return_value=None
-        ):
-            switch_result = self.manager.switch_profile("test_lifecycle")
+        switch_result = self.manager.switch_profile("test_lifecycle")
         assert switch_result.general.language == "ja"
 
         # Delete profile
@@ -435,7 +327,7 @@ class TestProfileManager:
         another_manager = ProfileManager(
             self.config_manager,
             ComponentFactory(self.default_config, self.config_manager),
-            Mock(),
+            None,  # No config change is triggered here
         )
 
         # Both should see same profiles
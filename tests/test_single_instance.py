@@ -3,12 +3,22 @@
 import os
 import subprocess
 import sys
-import time
 from pathlib import Path
 
+import pytest
+
+from whisper_to_me.single_instance import SingleInstance
+
+# Competing instance run in a child process while the test holds the lock
+_SECOND_INSTANCE = """
 from whisper_to_me.single_instance import SingleInstance
 
+with SingleInstance():
+    pass
+"""
+
 
+@pytest.mark.usefixtures("fresh_xdg_runtime_dir")
 class TestSingleInstance:
     """Test cases for single instance lock functionality."""
 
@@ -62,58 +72,31 @@ class TestSingleInstance:
 
     def test_multiple_instances_fail(self):
         """Test that second instance exits with error."""
-        # Create a small test script that uses SingleInstance
-        test_script = Path(__file__).parent / "test_instance_script.py"
-        test_script.write_text("""
-import time
-from whisper_to_me.single_instance import SingleInstance
-
-with SingleInstance():
-    time.sleep(1)  # Hold lock for 1 second
-""")
+        # Hold the lock here; flock conflicts across processes just the same
+        holder = SingleInstance()
+        assert holder.acquire() is True
 
         try:
-            # Start first instance with current environment
+            # Run the second instance with current environment
             env = os.environ.copy()
             # Add parent directory to PYTHONPATH for imports
             src_path = Path(__file__).parent.parent
             env["PYTHONPATH"] = str(src_path) + os.pathsep + env.get("PYTHONPATH", "")
 
-            proc1 = subprocess.Popen(
-                [sys.executable, str(test_script)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env,
-            )
-
-            # Give it time to acquire lock
-            time.sleep(0.2)  # Increased wait time for CI
-
-            # Try to start second instance
-            proc2 = subprocess.Popen(
-                [sys.executable, str(test_script)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            result = subprocess.run(
+                [sys.executable, "-c", _SECOND_INSTANCE],
+                capture_output=True,
                 text=True,
                 env=env,
+                timeout=5,
             )
-
-            # Wait for second instance
-            stdout2, stderr2 = proc2.communicate(timeout=5)
-
-            # Second instance should exit with code 1
-            assert proc2.returncode == 1
-            assert "already running" in stdout2
-            assert "Lock file location:" in stdout2
-
-            # Clean up first instance
-            proc1.terminate()
-            proc1.wait()
-
         finally:
-            # Remove test script
-            test_script.unlink(missing_ok=True)
+            holder.release()
+
+        # Second instance should exit with code 1
+        assert result.returncode == 1
+        assert "already running" in result.stdout
+        assert "Lock file location:" in result.stdout
 
     def test_crash_recovery(self):
         """Test that lock is released even after process crash."""
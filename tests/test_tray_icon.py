@@ -1,7 +1,5 @@
 """Test tray icon functionality."""
 
-import shutil
-import tempfile
 from unittest.mock import Mock, patch
 
 from PIL import Image
@@ -14,7 +12,6 @@ class TestTrayIcon:
 
     def setup_method(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
         self.mock_callbacks = {
             "on_quit": Mock(),
             "on_profile_change": Mock(),
@@ -29,10 +26,6 @@ class TestTrayIcon:
             get_current_profile=self.mock_callbacks["get_current_profile"],
         )
 
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_initialization(self):
         """Test tray icon initialization."""
         assert self.tray.icon is None
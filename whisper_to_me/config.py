@@ -7,6 +7,8 @@ Whisper-to-Me application.
 
 import os
 import tomllib
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, cast
@@ -36,6 +38,14 @@ from whisper_to_me.config_differ import ConfigSectionDiffer
 from whisper_to_me.config_validator import ConfigValidator, ValidationError
 from whisper_to_me.logger import get_logger
 
+# Parsed config files keyed by (path, inode, mtime_ns, ctime_ns, size), least
+# recently used first. ctime cannot be set from userspace and the inode changes
+# on atomic replace, so edits that restore the mtime are still noticed.
+_PARSE_CACHE: OrderedDict[tuple[str, int, int, int, int], dict[str, Any]] = (
+    OrderedDict()
+)
+_PARSE_CACHE_SIZE = 32
+
 
 @dataclass
 class RecordingConfig:
@@ -321,8 +331,9 @@ class ConfigManager:
 
         self._save_config_to_file(default_config)
 
-    def _save_config_to_file(self, config_dict: dict[str, Any]) -> None:
-        """Save configuration dictionary to TOML file."""
+    @staticmethod
+    def _serialize_config(config_dict: dict[str, Any]) -> bytes:
+        """Serialize a configuration dictionary to TOML bytes."""
 
         # Remove None values for TOML compatibility
         def remove_none_values(obj):
@@ -336,9 +347,42 @@ class ConfigManager:
                 return obj
 
         sanitized_config = cast(dict[str, Any], remove_none_values(config_dict))
+        return tomli_w.dumps(sanitized_config).encode()
+
+    def _save_config_to_file(self, config_dict: dict[str, Any]) -> None:
+        """Save configuration dictionary to TOML file."""
+        self.config_file.write_bytes(self._serialize_config(config_dict))
+
+        # Drop cached parses of the previous file contents
+        path = str(self.config_file)
+        for key in [key for key in _PARSE_CACHE if key[0] == path]:
+            del _PARSE_CACHE[key]
 
-        with open(self.config_file, "wb") as f:
-            tomli_w.dump(sanitized_config, f)
+    def _read_config_file(self) -> dict[str, Any]:
+        """Parse the TOML file, reusing the last parse while the file is unchanged.
+
+        Returns a copy because callers fill in defaults in place.
+        """
+        stat = self.config_file.stat()
+        key = (
+            str(self.config_file),
+            stat.st_ino,
+            stat.st_mtime_ns,
+            stat.st_ctime_ns,
+            stat.st_size,
+        )
+
+        parsed = _PARSE_CACHE.get(key)
+        if parsed is None:
+            with open(self.config_file, "rb") as f:
+                parsed = tomllib.load(f)
+            _PARSE_CACHE[key] = parsed
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        else:
+            _PARSE_CACHE.move_to_end(key)
+
+        return deepcopy(parsed)
 
     def _load_config_from_file(self) -> dict[str, Any]:
         """Load configuration from TOML file."""
@@ -346,8 +390,7 @@ class ConfigManager:
             self._create_default_config()
 
         try:
-            with open(self.config_file, "rb") as f:
-                return tomllib.load(f)
+            return self._read_config_file()
         except Exception as e:
             self.logger.error(f"Error loading config file: {e}", "config")
             self.logger.info("Using default configuration", "config")
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import threading
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pynput import keyboard
@@ -197,13 +198,16 @@ class _EvdevHotkeyBackend:
     # ----- setup ----------------------------------------------------------
 
     def _setup_hotkeys(self) -> None:
+        self._tap_mode = self._config.recording.mode == "tap-mode"
         self._trigger_codes = _parse_pynput_key_string(
             self._config.recording.trigger_key
         )
-        self._discard_codes = _parse_pynput_key_string(
-            self._config.recording.discard_key
+        # The discard key is only matched in tap mode
+        self._discard_codes = (
+            _parse_pynput_key_string(self._config.recording.discard_key)
+            if self._tap_mode
+            else []
         )
-        self._tap_mode = self._config.recording.mode == "tap-mode"
         self._trigger_active = False
 
     def _find_keyboards(self) -> list:  # list[evdev.InputDevice]
@@ -321,6 +325,12 @@ class _EvdevHotkeyBackend:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=64)
+def _parse_hotkey_cached(key_str: str) -> tuple:
+    """Parse a pynput key string, memoized since ``HotKey.parse`` is pure."""
+    return tuple(keyboard.HotKey.parse(key_str))
+
+
 class _PynputHotkeyBackend:
     """Global hotkey detection using pynput (X11)."""
 
@@ -329,6 +339,8 @@ class _PynputHotkeyBackend:
         self._config = config
 
         self.listener: keyboard.Listener | None = None
+        # Bound ``listener.canonical``; set only while the listener runs
+        self._canonical: Callable | None = None
         self.trigger_hotkey: keyboard.HotKey | None = None
         self.discard_hotkey: keyboard.HotKey | None = None
 
@@ -340,23 +352,40 @@ class _PynputHotkeyBackend:
 
         self._setup_hotkeys()
 
+    @staticmethod
+    def _hotkey_spec(config: AppConfig) -> tuple[bool, str, str | None]:
+        """Return the recording settings the hotkeys are built from."""
+        recording = config.recording
+        tap_mode = recording.mode == "tap-mode"
+        discard_key = recording.discard_key if tap_mode else None
+        return tap_mode, recording.trigger_key, discard_key
+
     def _setup_hotkeys(self) -> None:
         keyboard = self._keyboard
-        trigger_keys = keyboard.HotKey.parse(self._config.recording.trigger_key)
-        discard_keys = keyboard.HotKey.parse(self._config.recording.discard_key)
-
-        if self._config.recording.mode == "tap-mode":
-            self.trigger_hotkey = keyboard.HotKey(
-                trigger_keys, self._handle_trigger_tap
-            )
-            self.discard_hotkey = keyboard.HotKey(
-                discard_keys, self._handle_discard_tap
-            )
+        spec = self._hotkey_spec(self._config)
+        tap_mode, trigger_key, discard_key = spec
+        trigger_keys = list(_parse_hotkey_cached(trigger_key))
+
+        if tap_mode:
+            # The discard key is only used in tap mode, so only parse it here
+            discard_keys = list(_parse_hotkey_cached(discard_key))
+            trigger_hotkey = keyboard.HotKey(trigger_keys, self._handle_trigger_tap)
+            discard_hotkey = keyboard.HotKey(discard_keys, self._handle_discard_tap)
         else:
-            self.trigger_hotkey = keyboard.HotKey(
-                trigger_keys, self._handle_trigger_press
-            )
-            self.discard_hotkey = None
+            trigger_hotkey = keyboard.HotKey(trigger_keys, self._handle_trigger_press)
+            discard_hotkey = None
+
+        # Only swap state in once every key parsed, so an invalid key leaves
+        # the previous hotkeys active and the next update retries the rebuild
+        self._tap_mode = tap_mode
+        self._last_pressed = None
+        self.trigger_hotkey = trigger_hotkey
+        self.discard_hotkey = discard_hotkey
+        # Hotkeys fed by every key event, fixed until the next config update
+        self._hotkeys: tuple[keyboard.HotKey, ...] = (
+            (trigger_hotkey, discard_hotkey) if discard_hotkey else (trigger_hotkey,)
+        )
+        self._spec = spec
 
     # -- internal callbacks ------------------------------------------------
 
@@ -375,24 +404,27 @@ class _PynputHotkeyBackend:
     # -- key events --------------------------------------------------------
 
     def on_key_press(self, key) -> None:  # type: ignore[no-untyped-def]
-        if not self.listener:
+        canonical = self._canonical
+        if canonical is None:
             return
-        canonical_key = self.listener.canonical(key)
-        if self.trigger_hotkey:
-            self.trigger_hotkey.press(canonical_key)
-        if self.discard_hotkey:
-            self.discard_hotkey.press(canonical_key)
+        canonical_key = canonical(key)
+        # Auto-repeat resends a held key, which cannot change any hotkey state
+        if canonical_key == self._last_pressed:
+            return
+        self._last_pressed = canonical_key
+        for hotkey in self._hotkeys:
+            hotkey.press(canonical_key)
 
     def on_key_release(self, key) -> None:  # type: ignore[no-untyped-def]
-        if not self.listener:
+        canonical = self._canonical
+        if canonical is None:
             return
-        canonical_key = self.listener.canonical(key)
-        if self.trigger_hotkey:
-            self.trigger_hotkey.release(canonical_key)
-        if self.discard_hotkey:
-            self.discard_hotkey.release(canonical_key)
+        canonical_key = canonical(key)
+        self._last_pressed = None
+        for hotkey in self._hotkeys:
+            hotkey.release(canonical_key)
 
-        if self._config.recording.mode == "push-to-talk" and self.on_trigger_release:
+        if not self._tap_mode and self.on_trigger_release:
             self.on_trigger_release()
 
     # -- lifecycle ---------------------------------------------------------
@@ -400,15 +432,18 @@ class _PynputHotkeyBackend:
     def start_listening(self) -> None:
         if self.listener is not None:
             return
+        self._last_pressed = None
         self.listener = self._keyboard.Listener(
             on_press=self.on_key_press, on_release=self.on_key_release
         )
+        self._canonical = self.listener.canonical
         self.listener.start()
 
     def stop_listening(self) -> None:
         if self.listener is not None:
             self.listener.stop()
             self.listener = None
+            self._canonical = None
 
     def join_listener(self) -> None:
         if self.listener is not None:
@@ -416,7 +451,10 @@ class _PynputHotkeyBackend:
 
     def update_config(self, new_config: AppConfig) -> None:
         self._config = new_config
-        self._setup_hotkeys()
+        # Callers often pass the same mutated config, so compare against the
+        # settings the current hotkeys were built from rather than old config
+        if self._hotkey_spec(new_config) != self._spec:
+            self._setup_hotkeys()
 
 
 # ---------------------------------------------------------------------------
@@ -435,6 +473,20 @@ class HotkeyManager:
     - Clean listener lifecycle management
     """
 
+    __slots__ = (
+        "config",
+        "_tap_mode",
+        "_display_backend",
+        "_backend",
+        "listener",
+        "trigger_hotkey",
+        "discard_hotkey",
+        "on_trigger_press",
+        "on_trigger_tap",
+        "on_discard_tap",
+        "on_trigger_release",
+    )
+
     def __init__(
         self,
         config: AppConfig,
@@ -449,6 +501,7 @@ class HotkeyManager:
                 auto-detect.
         """
         self.config = config
+        self._tap_mode = config.recording.mode == "tap-mode"
 
         if backend is None:
             from whisper_to_me.display_backend import detect_backend
@@ -556,6 +609,7 @@ class HotkeyManager:
     def update_config(self, new_config: AppConfig) -> None:
         """Update hotkey configuration."""
         self.config = new_config
+        self._tap_mode = new_config.recording.mode == "tap-mode"
         self._backend.update_config(new_config)
         if isinstance(self._backend, _PynputHotkeyBackend):
             self.trigger_hotkey = self._backend.trigger_hotkey
@@ -572,4 +626,4 @@ class HotkeyManager:
         return self.config.recording.discard_key
 
     def is_tap_mode(self) -> bool:
-        return self.config.recording.mode == "tap-mode"
+        return self._tap_mode